@@ -1,13 +1,18 @@
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Body, Depends, Path, Query, Response
 
 from app.api.v1.endpoints.router_config.posting_config import Config
-from app.core.deps import get_current_user
-from app.models.client_auth_model import ClientAuthModel
+from app.core.deps import CurrentClient, get_current_user
+from app.models.posting_model import PostStatus
 from app.services.posting_services import PostingServices
 from app.schemas.posting_schema import (
+    BatchPostResponseWrapper,
+    BatchUpdatePostRequest,
     CreatePostRequest,
+    FreightQuoteRequest,
+    PostListResponseWrapper,
     PostResponseWrapper,
     UpdatePostRequest
 )
@@ -19,14 +24,9 @@ router = APIRouter()
 async def create_new_post(
         post_data: CreatePostRequest,
         posting_services: PostingServices = Depends(),
-        _: ClientAuthModel = Depends(get_current_user)
+        current_user: CurrentClient = Depends(get_current_user)
 ) -> PostResponseWrapper:
-    client_response = await posting_services.create_new_post(
-        post_data=post_data,
-        exchange="post_exchange",
-        routing_key="created_rk",
-        queue="created_queue"
-    )
+    client_response = await posting_services.create_new_post(post_data, current_user.client_id)
 
     return PostResponseWrapper(
         status_code=client_response["status_code"],
@@ -34,6 +34,68 @@ async def create_new_post(
         data=client_response["data"]
     )
 
+@router.post("/batch", **Config.new_batch())
+async def create_new_posts_batch(
+        response: Response,
+        posts_data: List[Dict[str, Any]] = Body(),
+        posting_services: PostingServices = Depends(),
+        current_user: CurrentClient = Depends(get_current_user)
+) -> BatchPostResponseWrapper:
+    client_response = await posting_services.create_new_posts(posts_data, current_user.client_id)
+    response.status_code = client_response["status_code"]
+
+    return BatchPostResponseWrapper(
+        status_code=client_response["status_code"],
+        message=client_response["message"],
+        data=client_response["data"]
+    )
+
+@router.post("/quote", **Config.quote())
+async def quote_freight(
+        parcels: List[FreightQuoteRequest],
+        posting_services: PostingServices = Depends(),
+        _: CurrentClient = Depends(get_current_user)
+) -> Response:
+    client_response = posting_services.quote_freight(parcels)
+
+    return Response(content=client_response, media_type="application/json")
+
+@router.get("", **Config.list_posts())
+async def list_posts(
+        limit: int = Query(
+            20,
+            ge=1,
+            le=100,
+            title="Tamanho da página.",
+            description="Quantidade máxima de postagens retornadas."
+        ),
+        cursor: Optional[str] = Query(
+            None,
+            title="Cursor de paginação.",
+            description="Valor de proximo_cursor retornado pela página anterior."
+        ),
+        status_postagem: Optional[PostStatus] = Query(
+            None,
+            title="Status da postagem.",
+            description="Filtra as postagens pelo status informado."
+        ),
+        posting_services: PostingServices = Depends(),
+        current_user: CurrentClient = Depends(get_current_user)
+) -> PostListResponseWrapper:
+    client_response = await posting_services.list_posts(
+        client_id=current_user.client_id,
+        limit=limit,
+        cursor=cursor,
+        status_postagem=status_postagem
+    )
+
+    return PostListResponseWrapper(
+        status_code=client_response["status_code"],
+        message=client_response["message"],
+        data=client_response["data"],
+        proximo_cursor=client_response["proximo_cursor"]
+    )
+
 @router.get("/info/{tracking_code}", **Config.get_info())
 async def get_post_info(
         tracking_code: UUID = Path(
@@ -41,11 +103,33 @@ async def get_post_info(
             description="Código de rastreamento (UUID) da postagem a ser retornada."
         ),
         posting_services: PostingServices = Depends(),
-        _: ClientAuthModel = Depends(get_current_user)
-) -> PostResponseWrapper:
+        _: CurrentClient = Depends(get_current_user)
+) -> Response:
     client_response = await posting_services.get_post_info(tracking_code)
 
-    return PostResponseWrapper(
+    return Response(content=client_response, media_type="application/json")
+
+@router.post("/info/batch", **Config.get_info_batch())
+async def get_posts_info_batch(
+        tracking_codes: List[UUID],
+        posting_services: PostingServices = Depends(),
+        _: CurrentClient = Depends(get_current_user)
+) -> Response:
+    client_response = await posting_services.get_posts_info(tracking_codes)
+
+    return Response(content=client_response, media_type="application/json")
+
+@router.put("/update/batch", **Config.update_batch())
+async def update_existent_posts_batch(
+        updates: List[BatchUpdatePostRequest],
+        response: Response,
+        posting_services: PostingServices = Depends(),
+        _: CurrentClient = Depends(get_current_user)
+) -> BatchPostResponseWrapper:
+    client_response = await posting_services.update_posts(updates)
+    response.status_code = client_response["status_code"]
+
+    return BatchPostResponseWrapper(
         status_code=client_response["status_code"],
         message=client_response["message"],
         data=client_response["data"]
@@ -59,14 +143,11 @@ async def update_existent_post(
             description="ID da postagem a ser atualizada."
         ),
         posting_services: PostingServices = Depends(),
-        _: ClientAuthModel = Depends(get_current_user)
+        _: CurrentClient = Depends(get_current_user)
 ) -> PostResponseWrapper:
     client_response = await posting_services.update_post(
         post_id=post_id,
-        updated_post=updated_post,
-        exchange="post_exchange",
-        routing_key="on_course_rk",
-        publish_queue="on_course_queue"
+        updated_post=updated_post
     )
 
     return PostResponseWrapper(
@@ -22,12 +22,12 @@ class Responses:
                                 "data_criacao": "22/12/2024 15:39:18",
                                 "status_postagem": "CRIADO",
                                 "data_envio": "null",
-                                "previsao_entrega": "11/01/2025",
+                                "previsao_entrega": "27/12/2024",
                                 "data_entrega": "null",
                                 "transportadora": "CORREIOS",
                                 "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
                                 "historico_atualizacoes": {
-                                    "22/12/2024 15:39:18": "CRIADO"
+                                    "2024-12-22T15:39:18.512304-03:00": "CRIADO"
                                 },
                                 "endereco": {
                                     "id": 1,
@@ -70,6 +70,103 @@ class Responses:
             }
         }
 
+    class NewPostBatch:
+        success = {
+            201: {
+                "description": "Todas as postagens foram criadas com sucesso.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 201,
+                            "message": "1 postagem(ns) criada(s) e 0 com falha.",
+                            "data": [
+                                {
+                                    "indice": 0,
+                                    "status_code": 201,
+                                    "message": "Postagem criada com sucesso.",
+                                    "data": {
+                                        "id": 1,
+                                        "endereco_id": 1,
+                                        "email": "JOAODASILVA@EMAIL.COM",
+                                        "peso": 6.8,
+                                        "altura": 10.0,
+                                        "largura": 5.0,
+                                        "comprimento": 10.0,
+                                        "volume": 500.0,
+                                        "valor_frete": 23.6,
+                                        "data_criacao": "22/12/2024 15:39:18",
+                                        "status_postagem": "CRIADO",
+                                        "data_envio": "null",
+                                        "previsao_entrega": "27/12/2024",
+                                        "data_entrega": "null",
+                                        "transportadora": "CORREIOS",
+                                        "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
+                                        "historico_atualizacoes": {
+                                            "2024-12-22T15:39:18.512304-03:00": "CRIADO"
+                                        },
+                                        "endereco": {
+                                            "id": 1,
+                                            "cep": "12345678",
+                                            "cidade": "RIO VERDE",
+                                            "estado": "GO",
+                                            "rua": "RUA FELICIDADE",
+                                            "bairro": "BAIRRO ALEGRIA",
+                                            "numero": "123",
+                                            "complemento": "APTO. 10"
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        partial_success = {
+            207: {
+                "description": "Parte das postagens não pôde ser criada.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 207,
+                            "message": "0 postagem(ns) criada(s) e 2 com falha.",
+                            "data": [
+                                {
+                                    "indice": 0,
+                                    "status_code": 400,
+                                    "message": "CEP inválido ou não encontrado.",
+                                    "data": None
+                                },
+                                {
+                                    "indice": 1,
+                                    "status_code": 400,
+                                    "message": "O peso deve ser maior que 0.",
+                                    "data": None
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        validation_errors = {
+            400: {
+                "description": "Erro de validação (lista vazia ou limite excedido).",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": [
+                                "Informe ao menos uma postagem.",
+                                "Limite de 1000 postagens por requisição excedido."
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
     class GetPostInfo:
         success = {
             200: {
@@ -92,12 +189,12 @@ class Responses:
                                 "data_criacao": "22/12/2024 15:39:18",
                                 "status_postagem": "CRIADO",
                                 "data_envio": "null",
-                                "previsao_entrega": "11/01/2025",
+                                "previsao_entrega": "27/12/2024",
                                 "data_entrega": "null",
                                 "transportadora": "CORREIOS",
                                 "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
                                 "historico_atualizacoes": {
-                                    "22/12/2024 15:39:18": "CRIADO"
+                                    "2024-12-22T15:39:18.512304-03:00": "CRIADO"
                                 },
                                 "endereco": {
                                     "id": 1,
@@ -129,6 +226,185 @@ class Responses:
             }
         }
 
+    class GetPostInfoBatch:
+        success = {
+            200: {
+                "description": "Postagens retornadas com sucesso.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 200,
+                            "message": "1 postagem(ns) encontrada(s) e 1 não encontrada(s).",
+                            "data": [
+                                {
+                                    "id": 1,
+                                    "endereco_id": 1,
+                                    "email": "JOAODASILVA@EMAIL.COM",
+                                    "peso": 6.8,
+                                    "altura": 10.0,
+                                    "largura": 5.0,
+                                    "comprimento": 10.0,
+                                    "volume": 500.0,
+                                    "valor_frete": 23.6,
+                                    "data_criacao": "22/12/2024 15:39:18",
+                                    "status_postagem": "CRIADO",
+                                    "data_envio": "null",
+                                    "previsao_entrega": "27/12/2024",
+                                    "data_entrega": "null",
+                                    "transportadora": "CORREIOS",
+                                    "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
+                                    "historico_atualizacoes": {
+                                        "2024-12-22T15:39:18.512304-03:00": "CRIADO"
+                                    },
+                                    "endereco": {
+                                        "id": 1,
+                                        "cep": "12345678",
+                                        "cidade": "RIO VERDE",
+                                        "estado": "GO",
+                                        "rua": "RUA FELICIDADE",
+                                        "bairro": "BAIRRO ALEGRIA",
+                                        "numero": "123",
+                                        "complemento": "APTO. 10"
+                                    }
+                                }
+                            ],
+                            "nao_encontrados": [
+                                "8f0f7c1e-2b4a-4f7e-9a53-0c1d2e3f4a5b"
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        validation_errors = {
+            400: {
+                "description": "Erro de validação (lista vazia ou limite excedido).",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": [
+                                "Informe ao menos um código de rastreamento.",
+                                "Limite de 100 códigos de rastreamento por requisição excedido."
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+    class FreightQuote:
+        success = {
+            200: {
+                "description": "Frete calculado com sucesso.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 200,
+                            "message": "Frete calculado para 2 encomenda(s).",
+                            "data": [
+                                {
+                                    "indice": 0,
+                                    "transportadora": "CORREIOS",
+                                    "volume": 500.0,
+                                    "valor_frete": 23.6,
+                                    "prazo_entrega": 5
+                                },
+                                {
+                                    "indice": 1,
+                                    "transportadora": "JADLOG",
+                                    "volume": 4000.0,
+                                    "valor_frete": 22.0,
+                                    "prazo_entrega": 20
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        validation_errors = {
+            400: {
+                "description": "Erro de validação (lista vazia, limite excedido ou dados inválidos).",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": [
+                                "Informe ao menos uma encomenda.",
+                                "Limite de 10000 encomendas por requisição excedido.",
+                                "Peso deve ser maior que 0.",
+                                "Transportadora é um campo obrigatório e não pode ser vazio.",
+                                "UF de destino inválida."
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+    class ListPosts:
+        success = {
+            200: {
+                "description": "Postagens retornadas com sucesso.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 200,
+                            "message": "1 postagem(ns) retornada(s).",
+                            "data": [
+                                {
+                                    "id": 1,
+                                    "endereco_id": 1,
+                                    "email": "JOAODASILVA@EMAIL.COM",
+                                    "peso": 6.8,
+                                    "altura": 10.0,
+                                    "largura": 5.0,
+                                    "comprimento": 10.0,
+                                    "volume": 500.0,
+                                    "valor_frete": 23.6,
+                                    "data_criacao": "22/12/2024 15:39:18",
+                                    "status_postagem": "CRIADO",
+                                    "data_envio": "null",
+                                    "previsao_entrega": "27/12/2024",
+                                    "data_entrega": "null",
+                                    "transportadora": "CORREIOS",
+                                    "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
+                                    "historico_atualizacoes": {
+                                        "2024-12-22T15:39:18.512304-03:00": "CRIADO"
+                                    },
+                                    "endereco": {
+                                        "id": 1,
+                                        "cep": "12345678",
+                                        "cidade": "RIO VERDE",
+                                        "estado": "GO",
+                                        "rua": "RUA FELICIDADE",
+                                        "bairro": "BAIRRO ALEGRIA",
+                                        "numero": "123",
+                                        "complemento": "APTO. 10"
+                                    }
+                                }
+                            ],
+                            "proximo_cursor": "eyJkYXRhX2NyaWFjYW8iOiAiMjAyNC0xMi0yMlQxNTozOToxOC0wMzowMCIsICJpZCI6IDF9"
+                        }
+                    }
+                }
+            }
+        }
+
+        invalid_cursor = {
+            400: {
+                "description": "Erro na query. O cursor de paginação informado é inválido.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "Cursor de paginação inválido."
+                        }
+                    }
+                }
+            }
+        }
+
     class UpdatePost:
         success = {
             200: {
@@ -151,13 +427,13 @@ class Responses:
                                 "data_criacao": "22/12/2024 17:23:45",
                                 "status_postagem": "EM_TRANSITO",
                                 "data_envio": "22/12/2024 17:23:59",
-                                "previsao_entrega": "11/01/2025",
+                                "previsao_entrega": "27/12/2024",
                                 "data_entrega": "22/12/2024 17:24:26",
                                 "transportadora": "CORREIOS",
                                 "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
                                 "historico_atualizacoes": {
-                                    "22/12/2024 17:23:45": "CRIADO",
-                                    "22/12/2024 17:23:59": "EM_TRANSITO"
+                                    "2024-12-22T17:23:45.104857-03:00": "CRIADO",
+                                    "2024-12-22T17:23:59.827391-03:00": "EM_TRANSITO"
                                 },
                                 "endereco": {
                                     "id": 1,
@@ -208,3 +484,108 @@ class Responses:
                 }
             }
         }
+
+    class UpdatePostBatch:
+        success = {
+            200: {
+                "description": "Todas as postagens foram atualizadas com sucesso.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 200,
+                            "message": "1 postagem(ns) atualizada(s) e 0 com falha.",
+                            "data": [
+                                {
+                                    "indice": 0,
+                                    "status_code": 200,
+                                    "message": "Postagem atualizada com sucesso.",
+                                    "data": {
+                                        "id": 1,
+                                        "endereco_id": 1,
+                                        "email": "JOAODASILVA@EMAIL.COM",
+                                        "peso": 6.8,
+                                        "altura": 10.0,
+                                        "largura": 5.0,
+                                        "comprimento": 10.0,
+                                        "volume": 500.0,
+                                        "valor_frete": 23.6,
+                                        "data_criacao": "22/12/2024 17:23:45",
+                                        "status_postagem": "EM_TRANSITO",
+                                        "data_envio": "22/12/2024 17:23:59",
+                                        "previsao_entrega": "27/12/2024",
+                                        "data_entrega": "null",
+                                        "transportadora": "CORREIOS",
+                                        "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
+                                        "historico_atualizacoes": {
+                                            "2024-12-22T17:23:45.104857-03:00": "CRIADO",
+                                            "2024-12-22T17:23:59.827391-03:00": "EM_TRANSITO"
+                                        },
+                                        "endereco": {
+                                            "id": 1,
+                                            "cep": "12345678",
+                                            "cidade": "RIO VERDE",
+                                            "estado": "GO",
+                                            "rua": "RUA FELICIDADE",
+                                            "bairro": "BAIRRO ALEGRIA",
+                                            "numero": "123",
+                                            "complemento": "APTO. 10"
+                                        }
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        partial_success = {
+            207: {
+                "description": "Parte das postagens não pôde ser atualizada.",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 207,
+                            "message": "0 postagem(ns) atualizada(s) e 3 com falha.",
+                            "data": [
+                                {
+                                    "indice": 0,
+                                    "status_code": 404,
+                                    "message": "Não foram encontradas postagens com o ID informado.",
+                                    "data": None
+                                },
+                                {
+                                    "indice": 1,
+                                    "status_code": 400,
+                                    "message": "Requisição inválida. Essa postagem já foi entregue ao destinatário.",
+                                    "data": None
+                                },
+                                {
+                                    "indice": 2,
+                                    "status_code": 409,
+                                    "message": "O status da postagem foi alterado por outra requisição. Tente novamente.",
+                                    "data": None
+                                }
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        validation_errors = {
+            400: {
+                "description": "Erro de validação (lista vazia, limite excedido ou status inválido).",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": [
+                                "Informe ao menos uma atualização.",
+                                "Limite de 1000 atualizações por requisição excedido.",
+                                "O status fornecido deve ser do tipo PostStatus (enum)."
+                            ]
+                        }
+                    }
+                }
+            }
+        }
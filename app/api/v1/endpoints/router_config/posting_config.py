@@ -1,6 +1,12 @@
 from fastapi import status
 
-from app.schemas.posting_schema import PostResponseWrapper
+from app.schemas.posting_schema import (
+    BatchPostResponseWrapper,
+    FreightQuoteResponseWrapper,
+    PostInfoBatchResponseWrapper,
+    PostListResponseWrapper,
+    PostResponseWrapper
+)
 from app.api.v1.endpoints.responses.posting_responses import Responses
 
 
@@ -19,6 +25,32 @@ class Config:
             }
         }
 
+    @staticmethod
+    def new_batch():
+        return {
+            "response_model": BatchPostResponseWrapper,
+            "status_code": status.HTTP_201_CREATED,
+            "summary": "Create New Posts In Batch",
+            "description": "Cria várias postagens em uma única requisição, informando o resultado de cada uma.",
+            "responses": {
+                **Responses.NewPostBatch.success,
+                **Responses.NewPostBatch.partial_success,
+                **Responses.NewPostBatch.validation_errors
+            },
+            "openapi_extra": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/CreatePostRequest"}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
     @staticmethod
     def update():
         return {
@@ -33,6 +65,20 @@ class Config:
             }
         }
 
+    @staticmethod
+    def update_batch():
+        return {
+            "response_model": BatchPostResponseWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Update Existent Posts In Batch",
+            "description": "Atualiza o status de várias postagens em uma única requisição, informando o resultado de cada uma.",
+            "responses": {
+                **Responses.UpdatePostBatch.success,
+                **Responses.UpdatePostBatch.partial_success,
+                **Responses.UpdatePostBatch.validation_errors
+            }
+        }
+
     @staticmethod
     def get_info():
         return {
@@ -45,3 +91,42 @@ class Config:
                 **Responses.GetPostInfo.invalid_tracking_code
             }
         }
+
+    @staticmethod
+    def get_info_batch():
+        return {
+            "response_model": PostInfoBatchResponseWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Get Existent Posts In Batch",
+            "description": "Retorna as informações de várias postagens a partir dos seus códigos de rastreamento.",
+            "responses": {
+                **Responses.GetPostInfoBatch.success,
+                **Responses.GetPostInfoBatch.validation_errors
+            }
+        }
+
+    @staticmethod
+    def list_posts():
+        return {
+            "response_model": PostListResponseWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "List Client Posts",
+            "description": "Lista as postagens do cliente autenticado, da mais recente para a mais antiga, com paginação por cursor.",
+            "responses": {
+                **Responses.ListPosts.success,
+                **Responses.ListPosts.invalid_cursor
+            }
+        }
+
+    @staticmethod
+    def quote():
+        return {
+            "response_model": FreightQuoteResponseWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Quote Freight",
+            "description": "Calcula o valor do frete de uma ou mais encomendas, sem criar postagens.",
+            "responses": {
+                **Responses.FreightQuote.success,
+                **Responses.FreightQuote.validation_errors
+            }
+        }
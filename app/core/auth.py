@@ -21,7 +21,7 @@ async def authenticate(client_id: int, client_secret: str):
 
         if not client:
             return None
-        if not verify_client_secret(client_secret, client.client_secret):
+        if not await verify_client_secret(client_secret, client.client_secret):
             return None
 
         return client
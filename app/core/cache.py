@@ -0,0 +1,39 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.__maxsize = maxsize
+        self.__ttl = ttl
+        self.__data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self.__data.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at <= monotonic():
+            del self.__data[key]
+            return default
+
+        self.__data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        self.__data[key] = (monotonic() + (self.__ttl if ttl is None else ttl), value)
+        self.__data.move_to_end(key)
+
+        while len(self.__data) > self.__maxsize:
+            self.__data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        self.__data.pop(key, None)
+
+    def clear(self):
+        self.__data.clear()
+
+    def __len__(self) -> int:
+        return len(self.__data)
@@ -1,4 +1,6 @@
 from os import environ
+from pathlib import Path
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -6,7 +8,15 @@ from pydantic import BaseModel
 class Settings(BaseModel):
 
     API_V1: str = "/api/v1"
+    LOG_LEVEL: str = environ.get("LOG_LEVEL", "INFO").upper()
+    LOG_SAMPLE_RATE: float = float(environ.get("LOG_SAMPLE_RATE", 0.1))
     DB_URL: str = environ.get("DB_URL")
+    DB_POOL_SIZE: int = int(environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_RECYCLE: int = int(environ.get("DB_POOL_RECYCLE", 1800))
+    DB_POOL_TIMEOUT: float = float(environ.get("DB_POOL_TIMEOUT", 30))
+    DB_STATEMENT_CACHE_SIZE: int = int(environ.get("DB_STATEMENT_CACHE_SIZE", 500))
+    DB_ECHO: bool = environ.get("DB_ECHO", "false").lower() == "true"
     JWT_SECRET: str = environ.get("JWT_SECRET")
     ALGORITHM: str = environ.get("ALGORITHM")
     TOKEN_EXPIRATION_MINUTES: int = int(environ.get("TOKEN_EXPIRATION_MINUTES"))
@@ -14,9 +24,66 @@ class Settings(BaseModel):
     RABBITMQ_PORT: int = int(environ.get("RABBITMQ_PORT"))
     RABBITMQ_DEFAULT_USER: str = environ.get("RABBITMQ_DEFAULT_USER")
     RABBITMQ_DEFAULT_PASS: str = environ.get("RABBITMQ_DEFAULT_PASS")
+    RABBITMQ_CHANNEL_POOL_SIZE: int = int(environ.get("RABBITMQ_CHANNEL_POOL_SIZE", 10))
+    OUTBOX_RELAY_BATCH_SIZE: int = int(environ.get("OUTBOX_RELAY_BATCH_SIZE", 100))
+    OUTBOX_RELAY_POLL_INTERVAL: float = float(environ.get("OUTBOX_RELAY_POLL_INTERVAL", 1))
+    NOTIFICATION_WORKER_CONCURRENCY: int = int(environ.get("NOTIFICATION_WORKER_CONCURRENCY", 10))
+    NOTIFICATION_MAX_RETRIES: int = int(environ.get("NOTIFICATION_MAX_RETRIES", 5))
+    NOTIFICATION_RETRY_BASE_DELAY: float = float(environ.get("NOTIFICATION_RETRY_BASE_DELAY", 5))
+    NOTIFICATION_METRICS_PORT: int = int(environ.get("NOTIFICATION_METRICS_PORT", 9100))
+    NOTIFICATION_METRICS_INTERVAL: float = float(environ.get("NOTIFICATION_METRICS_INTERVAL", 15))
     REDIS_HOST: str = environ.get("REDIS_HOST")
     REDIS_PORT: int = int(environ.get("REDIS_PORT"))
     REDIS_PASSWORD: str = environ.get("REDIS_PASSWORD")
+    SMTP_HOST: str = environ.get("SMTP_HOST")
+    SMTP_PORT: int = int(environ.get("SMTP_PORT", 587))
+    SMTP_USER: str = environ.get("SMTP_USER")
+    SMTP_PASSWORD: str = environ.get("SMTP_PASSWORD")
+    SMTP_USE_TLS: bool = environ.get("SMTP_USE_TLS", "false").lower() == "true"
+    SMTP_START_TLS: Optional[bool] = {"true": True, "false": False}.get(environ.get("SMTP_START_TLS", "").lower())
+    SMTP_POOL_SIZE: int = int(environ.get("SMTP_POOL_SIZE", 4))
+    SMTP_MAX_MESSAGES_PER_SESSION: int = int(environ.get("SMTP_MAX_MESSAGES_PER_SESSION", 100))
+    SMTP_TIMEOUT: float = float(environ.get("SMTP_TIMEOUT", 10))
+    REDIS_MAX_CONNECTIONS: int = int(environ.get("REDIS_MAX_CONNECTIONS", 50))
+    REDIS_POOL_TIMEOUT: float = float(environ.get("REDIS_POOL_TIMEOUT", 5))
+    REDIS_SOCKET_TIMEOUT: float = float(environ.get("REDIS_SOCKET_TIMEOUT", 2))
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = float(environ.get("REDIS_SOCKET_CONNECT_TIMEOUT", 2))
+    REDIS_HEALTH_CHECK_INTERVAL: int = int(environ.get("REDIS_HEALTH_CHECK_INTERVAL", 30))
+    HASHING_MAX_CONCURRENCY: int = int(environ.get("HASHING_MAX_CONCURRENCY", 4))
+    HASHING_QUEUE_TIMEOUT: float = float(environ.get("HASHING_QUEUE_TIMEOUT", 5))
+    PRINCIPAL_CACHE_MAXSIZE: int = int(environ.get("PRINCIPAL_CACHE_MAXSIZE", 10000))
+    PRINCIPAL_CACHE_TTL: int = int(environ.get("PRINCIPAL_CACHE_TTL", 60))
+    PRINCIPAL_CACHE_REDIS_ENABLED: bool = environ.get("PRINCIPAL_CACHE_REDIS_ENABLED", "true").lower() == "true"
+    PRINCIPAL_CACHE_REDIS_TTL: int = int(environ.get("PRINCIPAL_CACHE_REDIS_TTL", 300))
+    POST_CACHE_TTL: int = int(environ.get("POST_CACHE_TTL", 300))
+    POST_CACHE_L1_ENABLED: bool = environ.get("POST_CACHE_L1_ENABLED", "true").lower() == "true"
+    POST_CACHE_L1_MAXSIZE: int = int(environ.get("POST_CACHE_L1_MAXSIZE", 10000))
+    POST_CACHE_L1_TTL: int = int(environ.get("POST_CACHE_L1_TTL", 30))
+    POST_CACHE_LOCK_TTL: float = float(environ.get("POST_CACHE_LOCK_TTL", 5))
+    POST_CACHE_LOCK_WAIT: float = float(environ.get("POST_CACHE_LOCK_WAIT", 2))
+    POST_CACHE_LOCK_POLL_INTERVAL: float = float(environ.get("POST_CACHE_LOCK_POLL_INTERVAL", 0.05))
+    POSTING_BATCH_MAX_SIZE: int = int(environ.get("POSTING_BATCH_MAX_SIZE", 1000))
+    POSTING_UPDATE_BATCH_MAX_SIZE: int = int(environ.get("POSTING_UPDATE_BATCH_MAX_SIZE", 1000))
+    FREIGHT_RATES_PATH: str = environ.get(
+        "FREIGHT_RATES_PATH",
+        str(Path(__file__).resolve().parent.parent / "data" / "freight_rates.json")
+    )
+    FREIGHT_QUOTE_MAX_SIZE: int = int(environ.get("FREIGHT_QUOTE_MAX_SIZE", 10000))
+    ORIGIN_UF: str = environ.get("ORIGIN_UF", "SP").upper()
+    LEAD_TIMES_PATH: str = environ.get(
+        "LEAD_TIMES_PATH",
+        str(Path(__file__).resolve().parent.parent / "data" / "lead_times.json")
+    )
+    LEAD_TIMES_RELOAD_INTERVAL: float = float(environ.get("LEAD_TIMES_RELOAD_INTERVAL", 30))
+    POST_INFO_BATCH_MAX_SIZE: int = int(environ.get("POST_INFO_BATCH_MAX_SIZE", 100))
+    CEP_CACHE_MAXSIZE: int = int(environ.get("CEP_CACHE_MAXSIZE", 10000))
+    CEP_CACHE_TTL: int = int(environ.get("CEP_CACHE_TTL", 86400))
+    CEP_NEGATIVE_CACHE_TTL: int = int(environ.get("CEP_NEGATIVE_CACHE_TTL", 3600))
+    CEP_LOOKUP_TIMEOUT: float = float(environ.get("CEP_LOOKUP_TIMEOUT", 5))
+
+    @property
+    def RABBITMQ_URL(self) -> str:
+        return f"amqp://{self.RABBITMQ_DEFAULT_USER}:{self.RABBITMQ_DEFAULT_PASS}@{self.RABBITMQ_HOST}:{self.RABBITMQ_PORT}/"
 
     class Config:
         case_sensitive = True
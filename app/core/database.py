@@ -1,17 +1,57 @@
+from time import perf_counter
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.configs import settings
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_CHECKED_OUT_CONNECTIONS,
+    DB_QUERY_DURATION_SECONDS
+)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+
+    def _do_get(self):
+        started_at = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.observe(perf_counter() - started_at)
+
 
 engine: AsyncEngine = create_async_engine(
     settings.DB_URL,
+    poolclass=TimedAsyncAdaptedQueuePool,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
     future=True,
-    echo=True
+    echo=settings.DB_ECHO
 )
 
+DB_POOL_CHECKED_OUT_CONNECTIONS.set_function(lambda: engine.pool.checkedout())
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _observe_query_duration(conn, cursor, statement, parameters, context, executemany):
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+    DB_QUERY_DURATION_SECONDS.labels(operation=operation).observe(
+        perf_counter() - context._query_started_at
+    )
+
 Base = declarative_base()
 
 async_session = async_sessionmaker(
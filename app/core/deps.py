@@ -1,20 +1,98 @@
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional
+
+import redis.asyncio as redis
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select, and_
 from fastapi import Depends, HTTPException, status
 from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.configs import settings
 from app.core.database import get_session
+from app.core.redis import get_redis
 from app.models.client_auth_model import ClientAuthModel
 
+logger = logging.getLogger(__name__)
+
 oauth2_schema = HTTPBearer(scheme_name="BearerJWT")
 
+_principal_cache = TTLCache(maxsize=settings.PRINCIPAL_CACHE_MAXSIZE, ttl=settings.PRINCIPAL_CACHE_TTL)
+
+
+@dataclass(frozen=True)
+class CurrentClient:
+    client_id: int
+    data_cadastro: datetime
+    nome: str
+    cpf_cnpj: str
+
+    @classmethod
+    def from_model(cls, usuario: ClientAuthModel) -> "CurrentClient":
+        return cls(
+            client_id=usuario.client_id,
+            data_cadastro=usuario.data_cadastro,
+            nome=usuario.nome,
+            cpf_cnpj=usuario.cpf_cnpj
+        )
+
+
+def _principal_key(cpf_cnpj: str) -> str:
+    return f"principal:{cpf_cnpj}"
+
+
+def _dump_principal(usuario: CurrentClient) -> str:
+    return json.dumps({**asdict(usuario), "data_cadastro": usuario.data_cadastro.isoformat()})
+
+
+def _load_principal(cached_principal: str) -> CurrentClient:
+    data = json.loads(cached_principal)
+    return CurrentClient(**{**data, "data_cadastro": datetime.fromisoformat(data["data_cadastro"])})
+
+
+async def _get_cached_principal(cpf_cnpj: str, redis_client: redis.Redis) -> Optional[CurrentClient]:
+    usuario = _principal_cache.get(cpf_cnpj)
+    if usuario is not None or not settings.PRINCIPAL_CACHE_REDIS_ENABLED:
+        return usuario
+
+    try:
+        cached_principal = await redis_client.get(_principal_key(cpf_cnpj))
+    except redis.RedisError as e:
+        logger.warning("Falha ao consultar o cache de autenticação no Redis. Erro: %s", e)
+        return None
+
+    if cached_principal is None:
+        return None
+
+    usuario = _load_principal(cached_principal)
+    _principal_cache.set(cpf_cnpj, usuario)
+    return usuario
+
+
+async def _cache_principal(usuario: CurrentClient, redis_client: redis.Redis):
+    _principal_cache.set(usuario.cpf_cnpj, usuario)
+    if not settings.PRINCIPAL_CACHE_REDIS_ENABLED:
+        return
+
+    try:
+        await redis_client.setex(
+            _principal_key(usuario.cpf_cnpj),
+            settings.PRINCIPAL_CACHE_REDIS_TTL,
+            _dump_principal(usuario)
+        )
+    except redis.RedisError as e:
+        logger.warning("Falha ao gravar o cache de autenticação no Redis. Erro: %s", e)
+
 
 async def get_current_user(
         db: AsyncSession = Depends(get_session),
+        redis_client: redis.Redis = Depends(get_redis),
         token: HTTPAuthorizationCredentials = Depends(oauth2_schema)
-) -> ClientAuthModel:
+) -> CurrentClient:
     credential_exception: HTTPException = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Não foi possível autenticar a credencial.",
@@ -35,14 +113,21 @@ async def get_current_user(
     except JWTError:
         raise credential_exception
 
+    usuario = await _get_cached_principal(cpf_cnpj, redis_client)
+    if usuario is not None:
+        return usuario
+
     query = await db.execute(
         select(ClientAuthModel).where(
             and_(ClientAuthModel.cpf_cnpj == cpf_cnpj)
         )
     )
-    usuario = query.scalars().first()
+    client = query.scalars().first()
 
-    if usuario is None:
+    if client is None:
         raise credential_exception
 
+    usuario = CurrentClient.from_model(client)
+    await _cache_principal(usuario, redis_client)
+
     return usuario
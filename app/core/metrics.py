@@ -0,0 +1,110 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+REDIS_POOL_MAX_CONNECTIONS = Gauge(
+    "redis_pool_max_connections",
+    "Quantidade máxima de conexões do pool do Redis."
+)
+REDIS_POOL_IN_USE_CONNECTIONS = Gauge(
+    "redis_pool_in_use_connections",
+    "Conexões do pool do Redis em uso."
+)
+REDIS_POOL_IDLE_CONNECTIONS = Gauge(
+    "redis_pool_idle_connections",
+    "Conexões abertas do pool do Redis aguardando reutilização."
+)
+
+HASHING_QUEUE_WAIT_SECONDS = Histogram(
+    "hashing_queue_wait_seconds",
+    "Tempo de espera por uma vaga no executor de hashing (bcrypt).",
+    ["operation"]
+)
+HASHING_DURATION_SECONDS = Histogram(
+    "hashing_duration_seconds",
+    "Tempo de execução do hashing (bcrypt) no executor.",
+    ["operation"]
+)
+HASHING_REJECTED_TOTAL = Counter(
+    "hashing_rejected_total",
+    "Operações de hashing recusadas por exceder o tempo de espera na fila.",
+    ["operation"]
+)
+
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Tempo de espera para obter uma conexão do pool do banco de dados."
+)
+DB_POOL_CHECKED_OUT_CONNECTIONS = Gauge(
+    "db_pool_checked_out_connections",
+    "Conexões do pool do banco de dados em uso."
+)
+DB_QUERY_DURATION_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Tempo de execução das consultas no banco de dados.",
+    ["operation"]
+)
+
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Tempo de resposta das requisições HTTP por rota.",
+    ["method", "route", "status_code"]
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em processamento."
+)
+
+POST_CACHE_REQUESTS_TOTAL = Counter(
+    "post_cache_requests_total",
+    "Consultas ao cache de postagens por camada (local ou redis) e resultado (hit ou miss).",
+    ["tier", "result"]
+)
+
+RABBITMQ_PUBLISH_DURATION_SECONDS = Histogram(
+    "rabbitmq_publish_duration_seconds",
+    "Tempo de publicação de cada lote de mensagens no RabbitMQ, até a confirmação.",
+    ["routing_key"]
+)
+RABBITMQ_PUBLISH_BATCH_SIZE = Histogram(
+    "rabbitmq_publish_batch_size",
+    "Quantidade de mensagens publicadas por lote com confirmação conjunta.",
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+RABBITMQ_PUBLISH_ERRORS_TOTAL = Counter(
+    "rabbitmq_publish_errors_total",
+    "Falhas na publicação de mensagens no RabbitMQ.",
+    ["routing_key"]
+)
+
+NOTIFICATION_MESSAGE_LAG_SECONDS = Histogram(
+    "notification_message_lag_seconds",
+    "Tempo entre a publicação de uma mensagem e o início do seu processamento pelo worker.",
+    ["queue"],
+    buckets=(0.05, 0.1, 0.5, 1, 5, 15, 30, 60, 300, 900, 3600)
+)
+NOTIFICATION_QUEUE_DEPTH = Gauge(
+    "notification_queue_depth",
+    "Mensagens aguardando processamento em cada fila do worker de notificações.",
+    ["queue"]
+)
+NOTIFICATION_MESSAGES_TOTAL = Counter(
+    "notification_messages_total",
+    "Mensagens processadas pelo worker de notificações por resultado.",
+    ["queue", "result"]
+)
+
+EMAIL_SEND_DURATION_SECONDS = Histogram(
+    "email_send_duration_seconds",
+    "Tempo de envio dos e-mails pelo dispatcher SMTP.",
+    ["result"]
+)
+
+OUTBOX_MESSAGES_RELAYED_TOTAL = Counter(
+    "outbox_messages_relayed_total",
+    "Mensagens da outbox publicadas no RabbitMQ pelo relay.",
+    ["routing_key"]
+)
+OUTBOX_RELAY_LAG_SECONDS = Histogram(
+    "outbox_relay_lag_seconds",
+    "Tempo entre a gravação de uma mensagem na outbox e a sua confirmação pelo RabbitMQ.",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 15, 30, 60, 300)
+)
@@ -0,0 +1,67 @@
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.configs import settings
+from app.core.metrics import (
+    REDIS_POOL_MAX_CONNECTIONS,
+    REDIS_POOL_IN_USE_CONNECTIONS,
+    REDIS_POOL_IDLE_CONNECTIONS
+)
+
+
+class RedisPool:
+    def __init__(self):
+        self.__pool: Optional[redis.BlockingConnectionPool] = None
+        self.__client: Optional[redis.Redis] = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self.__client is None:
+            raise RuntimeError("O pool de conexões do Redis não foi inicializado.")
+        return self.__client
+
+    @property
+    def in_use_connections(self) -> int:
+        return len(self.__pool._in_use_connections) if self.__pool else 0
+
+    @property
+    def idle_connections(self) -> int:
+        return len(self.__pool._available_connections) if self.__pool else 0
+
+    async def connect(self):
+        if self.__client is not None:
+            return
+
+        self.__pool = redis.BlockingConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            password=settings.REDIS_PASSWORD,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL
+        )
+        self.__client = redis.Redis(connection_pool=self.__pool)
+        REDIS_POOL_MAX_CONNECTIONS.set(settings.REDIS_MAX_CONNECTIONS)
+
+    async def close(self):
+        if self.__client is not None:
+            await self.__client.aclose()
+        if self.__pool is not None:
+            await self.__pool.disconnect()
+
+        self.__client = None
+        self.__pool = None
+
+
+redis_pool = RedisPool()
+
+REDIS_POOL_IN_USE_CONNECTIONS.set_function(lambda: redis_pool.in_use_connections)
+REDIS_POOL_IDLE_CONNECTIONS.set_function(lambda: redis_pool.idle_connections)
+
+
+async def get_redis() -> redis.Redis:
+    return redis_pool.client
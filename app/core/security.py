@@ -1,11 +1,47 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from app.core.configs import settings
+from app.core.metrics import HASHING_QUEUE_WAIT_SECONDS, HASHING_DURATION_SECONDS, HASHING_REJECTED_TOTAL
+
 criptography = CryptContext(schemes=['bcrypt'], deprecated='auto')
 
+_hashing_executor = ThreadPoolExecutor(
+    max_workers=settings.HASHING_MAX_CONCURRENCY,
+    thread_name_prefix="bcrypt"
+)
+_hashing_slots = asyncio.Semaphore(settings.HASHING_MAX_CONCURRENCY)
+
+
+async def _run_hashing(operation: str, func: Callable[..., Any], *args: Any) -> Any:
+    queued_at = perf_counter()
+    try:
+        await asyncio.wait_for(_hashing_slots.acquire(), timeout=settings.HASHING_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        HASHING_REJECTED_TOTAL.labels(operation=operation).inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Serviço temporariamente sobrecarregado. Tente novamente em instantes."
+        )
+
+    started_at = perf_counter()
+    HASHING_QUEUE_WAIT_SECONDS.labels(operation=operation).observe(started_at - queued_at)
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hashing_executor, func, *args)
+    finally:
+        HASHING_DURATION_SECONDS.labels(operation=operation).observe(perf_counter() - started_at)
+        _hashing_slots.release()
+
 
-def generate_client_secret_hash(client_secret: str) -> str:
-    return criptography.hash(client_secret)
+async def generate_client_secret_hash(client_secret: str) -> str:
+    return await _run_hashing("hash", criptography.hash, client_secret)
 
 
-def verify_client_secret(received_secret: str, client_secret: str) -> bool:
-    return criptography.verify(received_secret, client_secret)
+async def verify_client_secret(received_secret: str, client_secret: str) -> bool:
+    return await _run_hashing("verify", criptography.verify, received_secret, client_secret)
@@ -1,11 +1,42 @@
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from app.core.configs import settings
 from app.api.v1.api import router
+from app.core.logger import setup_logging
+from app.core.middlewares import PrometheusMiddleware, RequestIdMiddleware
+from app.core.redis import redis_pool
+from app.services.freight_engine import freight_engine
+from app.services.lead_time_table import lead_time_table
+from app.services.outbox_relay import outbox_relay
+from app.services.rabbitmq_publisher import rabbitmq_publisher
+from app.services.tracking_cache import tracking_cache_subscriber
 
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    log_listener = setup_logging()
+    freight_engine.load()
+    lead_time_table.load()
+    await redis_pool.connect()
+    await rabbitmq_publisher.connect()
+    outbox_relay.start()
+    tracking_cache_subscriber.start(redis_pool.client)
+    lead_time_table.start()
+    yield
+    await lead_time_table.stop()
+    await tracking_cache_subscriber.stop()
+    await outbox_relay.stop()
+    await rabbitmq_publisher.close()
+    await redis_pool.close()
+    log_listener.stop()
+
+
 app = FastAPI(
     title="API - Sistema de Postagens",
     description="""
@@ -21,7 +52,12 @@ app = FastAPI(
     - POST auth/register: Recebe os dados do cliente a ser cadastrado como utilizador da API.
     - POST auth: Recebe os dados do cliente e retorna um token JWT e sua duração para autenticação na API.
     - POST posting/new: Cria uma nova postagem.
+    - POST posting/batch: Cria várias postagens em uma única requisição.
+    - POST posting/quote: Calcula o frete de uma ou mais encomendas sem criar postagens.
+    - GET posting: Lista as postagens do cliente autenticado, com paginação por cursor.
     - GET posting/info/{tracking_code}: Retorna as informações de uma postagem.
+    - POST posting/info/batch: Retorna as informações de várias postagens em uma única requisição.
+    - PUT posting/update/batch: Atualiza o status de várias postagens em uma única requisição.
     - PUT posting/update/{post_id}: Atualiza as informações de uma postagem.
 
     Possíveis erros:
@@ -33,9 +69,17 @@ app = FastAPI(
     - 500: Erro interno do servidor ao processar a requisição.
     """,
     version="1.0",
+    lifespan=lifespan
 )
+app.add_middleware(PrometheusMiddleware)
+app.add_middleware(RequestIdMiddleware)
 app.include_router(router, prefix=settings.API_V1)
 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 if __name__ == '__main__':
     import uvicorn
 
@@ -26,6 +26,8 @@ if config.config_file_name is not None:
 from app.models.posting_model import PostModel
 from app.models.client_auth_model import ClientAuthModel
 from app.models.address_model import AddressModel
+from app.models.post_event_model import PostEventModel
+from app.models.outbox_model import OutboxMessageModel
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
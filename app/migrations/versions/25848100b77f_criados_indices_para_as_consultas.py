@@ -0,0 +1,61 @@
+"""Criados os índices utilizados pelas consultas da API.
+
+Revision ID: 25848100b77f
+Revises: 9ae9105108dc
+Create Date: 2026-10-18 10:12:41.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '25848100b77f'
+down_revision: Union[str, None] = '9ae9105108dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY não pode ser executado dentro de uma transação.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_clientes_cpf_cnpj'),
+            'clientes',
+            ['cpf_cnpj'],
+            unique=True,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            op.f('ix_postagens_endereco_id'),
+            'postagens',
+            ['endereco_id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_postagens_status_postagem_data_criacao',
+            'postagens',
+            ['status_postagem', 'data_criacao'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_postagens_status_postagem_data_criacao',
+            table_name='postagens',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            op.f('ix_postagens_endereco_id'),
+            table_name='postagens',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            op.f('ix_clientes_cpf_cnpj'),
+            table_name='clientes',
+            postgresql_concurrently=True
+        )
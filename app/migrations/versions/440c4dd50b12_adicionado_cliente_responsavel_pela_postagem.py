@@ -0,0 +1,53 @@
+"""Adicionado o cliente responsável pela postagem.
+
+Revision ID: 440c4dd50b12
+Revises: 25848100b77f
+Create Date: 2026-10-18 13:05:27.514903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '440c4dd50b12'
+down_revision: Union[str, None] = '25848100b77f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Coluna nula e FK NOT VALID: nenhuma reescrita da tabela. A validação e o índice são feitos fora
+    # da transação, sem bloquear as escritas na tabela de postagens.
+    op.add_column('postagens', sa.Column('client_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_postagens_client_id_clientes',
+        'postagens',
+        'clientes',
+        ['client_id'],
+        ['client_id'],
+        postgresql_not_valid=True
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute('ALTER TABLE postagens VALIDATE CONSTRAINT fk_postagens_client_id_clientes')
+        op.create_index(
+            'ix_postagens_client_id_data_criacao_id',
+            'postagens',
+            ['client_id', 'data_criacao', 'id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_postagens_client_id_data_criacao_id',
+            table_name='postagens',
+            postgresql_concurrently=True
+        )
+
+    op.drop_constraint('fk_postagens_client_id_clientes', 'postagens', type_='foreignkey')
+    op.drop_column('postagens', 'client_id')
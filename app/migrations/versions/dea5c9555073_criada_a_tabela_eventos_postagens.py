@@ -0,0 +1,67 @@
+"""Criada a tabela eventos_postagens, substituindo a coluna historico_atualizacoes.
+
+Revision ID: dea5c9555073
+Revises: 440c4dd50b12
+Create Date: 2026-10-18 13:41:09.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'dea5c9555073'
+down_revision: Union[str, None] = '440c4dd50b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('eventos_postagens',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('postagem_id', sa.Integer(), nullable=False),
+    sa.Column('status_postagem', postgresql.ENUM('CRIADO', 'EM_TRANSITO', 'ENTREGUE', name='poststatus', create_type=False), nullable=False),
+    sa.Column('ocorrido_em', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['postagem_id'], ['postagens.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_eventos_postagens_postagem_id_ocorrido_em', 'eventos_postagens', ['postagem_id', 'ocorrido_em'], unique=False)
+
+    # As chaves do histórico estão no formato "%d/%m/%Y %H:%M:%S", no horário de São Paulo.
+    op.execute("""
+        INSERT INTO eventos_postagens (postagem_id, status_postagem, ocorrido_em)
+        SELECT p.id,
+               (h.value #>> '{}')::poststatus,
+               to_timestamp(h.key, 'DD/MM/YYYY HH24:MI:SS')::timestamp AT TIME ZONE 'America/Sao_Paulo'
+        FROM postagens p
+        CROSS JOIN LATERAL jsonb_each(p.historico_atualizacoes) h
+    """)
+
+    op.drop_column('postagens', 'historico_atualizacoes')
+
+
+def downgrade() -> None:
+    op.add_column('postagens', sa.Column('historico_atualizacoes', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+    op.execute("""
+        UPDATE postagens p
+        SET historico_atualizacoes = e.historico
+        FROM (
+            SELECT postagem_id,
+                   jsonb_object_agg(
+                       to_char(ocorrido_em AT TIME ZONE 'America/Sao_Paulo', 'DD/MM/YYYY HH24:MI:SS'),
+                       status_postagem::text
+                       ORDER BY ocorrido_em
+                   ) AS historico
+            FROM eventos_postagens
+            GROUP BY postagem_id
+        ) e
+        WHERE p.id = e.postagem_id
+    """)
+    op.execute("UPDATE postagens SET historico_atualizacoes = '{}'::jsonb WHERE historico_atualizacoes IS NULL")
+    op.alter_column('postagens', 'historico_atualizacoes', nullable=False)
+
+    op.drop_index('ix_eventos_postagens_postagem_id_ocorrido_em', table_name='eventos_postagens')
+    op.drop_table('eventos_postagens')
@@ -13,7 +13,7 @@ class ClientAuthModel(Base):
     client_id = Column(Integer, primary_key=True, autoincrement=True)
     data_cadastro = Column(DateTime(timezone=True), nullable=False)
     nome = Column(String, nullable=False)
-    cpf_cnpj = Column(String, nullable=False)
+    cpf_cnpj = Column(String, nullable=False, unique=True, index=True)
     client_secret = Column(String, nullable=False)
     hash_token = Column(String, nullable=False)
     token_expiracao = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.core.database import Base
+
+
+class OutboxMessageModel(Base):
+    __tablename__ = "outbox_postagens"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    routing_key = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    correlation_id = Column(String, nullable=True)
+    criado_em = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
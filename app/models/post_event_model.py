@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Column, DateTime, Enum, ForeignKey, Index, Integer
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+from app.models.posting_model import PostStatus
+
+
+class PostEventModel(Base):
+    __tablename__ = "eventos_postagens"
+    __table_args__ = (
+        Index("ix_eventos_postagens_postagem_id_ocorrido_em", "postagem_id", "ocorrido_em"),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    postagem_id = Column(Integer, ForeignKey("postagens.id", ondelete="CASCADE"), nullable=False)
+    status_postagem = Column(Enum(PostStatus), nullable=False)
+    ocorrido_em = Column(DateTime(timezone=True), nullable=False)
+
+    postagem = relationship("PostModel", back_populates="eventos")
@@ -1,8 +1,8 @@
 import enum
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship, mapped_column
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Float, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
@@ -15,9 +15,14 @@ class PostStatus(enum.Enum):
 
 class PostModel(Base):
     __tablename__ = "postagens"
+    __table_args__ = (
+        Index("ix_postagens_status_postagem_data_criacao", "status_postagem", "data_criacao"),
+        Index("ix_postagens_client_id_data_criacao_id", "client_id", "data_criacao", "id"),
+    )
 
     id = Column(Integer, primary_key=True, nullable=False, index=True)
-    endereco_id = Column(Integer, ForeignKey("enderecos.id"), nullable=False)
+    endereco_id = Column(Integer, ForeignKey("enderecos.id"), nullable=False, index=True)
+    client_id = Column(Integer, ForeignKey("clientes.client_id", name="fk_postagens_client_id_clientes"), nullable=True)
     email = Column(String, nullable=False)
     peso = Column(Float, nullable=False)
     altura = Column(Float, nullable=False)
@@ -32,6 +37,12 @@ class PostModel(Base):
     data_entrega = Column(DateTime(timezone=True), nullable=True)
     transportadora = Column(String, nullable=False)
     codigo_rastreamento = Column(UUID(as_uuid=True), unique=True, nullable=False)
-    historico_atualizacoes = mapped_column(JSONB, nullable=False)
 
     endereco = relationship("AddressModel", back_populates="postagens", lazy="joined")
+    eventos = relationship(
+        "PostEventModel",
+        back_populates="postagem",
+        lazy="selectin",
+        order_by="PostEventModel.ocorrido_em",
+        passive_deletes=True
+    )
@@ -1,13 +1,14 @@
 import re
 from pytz import timezone
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, field_validator, Field, EmailStr
 from fastapi import HTTPException, status
 
 from app.models.address_model import AddressModel
 from app.models.posting_model import PostModel, PostStatus
+from app.core.constants import UFS
 
 
 class AddressRequest(BaseModel):
@@ -197,9 +198,9 @@ class PostResponse(BaseModel):
     )
     historico_atualizacoes: dict = Field(
         title="Histórico de atualizações.",
-        description="Histórico de atualização de status da encomenda.",
+        description="Histórico de atualização de status da encomenda, indexado pelo instante (ISO 8601) de cada alteração.",
         examples=[{
-            "22/12/2024 15:39:18": "CRIADO"
+            "2024-12-22T15:39:18.512304-03:00": "CRIADO"
         }]
     )
     endereco: AddressResponse = Field(
@@ -236,17 +237,15 @@ class PostResponse(BaseModel):
             data_entrega=post.data_entrega.astimezone(timezone("America/Sao_Paulo")).strftime("%d/%m/%Y %H:%M:%S") if post.data_entrega else None,
             transportadora=post.transportadora.upper(),
             codigo_rastreamento=post.codigo_rastreamento,
-            historico_atualizacoes=post.historico_atualizacoes,
+            historico_atualizacoes={
+                event.ocorrido_em.astimezone(timezone("America/Sao_Paulo")).isoformat(): event.status_postagem.value
+                for event in post.eventos
+            },
             endereco=AddressResponse.from_model(post.endereco)
         )
 
 
-class CreatePostRequest(BaseModel):
-    email: EmailStr = Field(
-        title="E-mail do destinatário.",
-        description="E-mail do destinatário da encomenda.",
-        examples=["JOAODASILVA@EMAIL.COM"]
-    )
+class ParcelRequest(BaseModel):
     peso: float = Field(
         title="Peso da encomenda (em Kg).",
         description="Peso da encomenda (em Kg) a ser postada.",
@@ -272,17 +271,6 @@ class CreatePostRequest(BaseModel):
         description="Transportadora que efetuará a entrega.",
         examples=["CORREIOS"]
     )
-    endereco: AddressRequest = Field(
-        title="Endereço do destinatário.",
-        description="Informar CEP, número e complemento do endereço do destinatário.",
-        examples=[
-            {
-                "cep": "12345678",
-                "numero": "123",
-                "complemento": "APTO. 10"
-            }
-        ]
-    )
 
     @field_validator("peso", mode="before")
     def validate_peso(cls, v):
@@ -312,6 +300,46 @@ class CreatePostRequest(BaseModel):
         return v.upper()
 
 
+class FreightQuoteRequest(ParcelRequest):
+    uf_destino: Optional[str] = Field(
+        None,
+        title="UF de destino.",
+        description="UF do destinatário, utilizada no cálculo do prazo de entrega.",
+        examples=["GO"]
+    )
+
+    @field_validator("uf_destino", mode="before")
+    def validate_uf_destino(cls, v):
+        if v is None:
+            return v
+
+        if v.strip().upper() not in UFS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="UF de destino inválida."
+            )
+        return v.strip().upper()
+
+
+class CreatePostRequest(ParcelRequest):
+    email: EmailStr = Field(
+        title="E-mail do destinatário.",
+        description="E-mail do destinatário da encomenda.",
+        examples=["JOAODASILVA@EMAIL.COM"]
+    )
+    endereco: AddressRequest = Field(
+        title="Endereço do destinatário.",
+        description="Informar CEP, número e complemento do endereço do destinatário.",
+        examples=[
+            {
+                "cep": "12345678",
+                "numero": "123",
+                "complemento": "APTO. 10"
+            }
+        ]
+    )
+
+
 class UpdatePostRequest(BaseModel):
     status_postagem: PostStatus = Field(
         title="Status da postagem.",
@@ -329,6 +357,14 @@ class UpdatePostRequest(BaseModel):
         return v.upper()
 
 
+class BatchUpdatePostRequest(UpdatePostRequest):
+    post_id: int = Field(
+        title="ID da postagem.",
+        description="ID da postagem a ser atualizada.",
+        examples=[1]
+    )
+
+
 class PostResponseWrapper(BaseModel):
     status_code: int = Field(
         title="Código HTTP.",
@@ -342,3 +378,123 @@ class PostResponseWrapper(BaseModel):
         title="Dados da postagem.",
         description="Dados completos da postagem."
     )
+
+
+class BatchPostResult(BaseModel):
+    indice: int = Field(
+        title="Índice da postagem.",
+        description="Posição da postagem na lista enviada.",
+        examples=[0]
+    )
+    status_code: int = Field(
+        title="Código HTTP.",
+        description="Código HTTP indicando o resultado da operação na postagem.",
+        examples=[201]
+    )
+    message: str = Field(
+        title="Mensagem de resposta.",
+        description="Mensagem que descreve o resultado da operação na postagem.",
+        examples=["Postagem criada com sucesso."]
+    )
+    data: Optional[PostResponse] = Field(
+        None,
+        title="Dados da postagem.",
+        description="Dados completos da postagem, quando criada ou atualizada com sucesso."
+    )
+
+
+class BatchPostResponseWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP.",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta.",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: List[BatchPostResult] = Field(
+        title="Resultados das postagens.",
+        description="Resultado de cada postagem, na mesma ordem do envio."
+    )
+
+
+class PostInfoBatchResponseWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP.",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta.",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: List[PostResponse] = Field(
+        title="Dados das postagens.",
+        description="Dados completos das postagens encontradas, na mesma ordem do envio."
+    )
+    nao_encontrados: List[UUID] = Field(
+        title="Códigos não encontrados.",
+        description="Códigos de rastreamento informados que não correspondem a nenhuma postagem."
+    )
+
+
+class PostListResponseWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP.",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta.",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: List[PostResponse] = Field(
+        title="Dados das postagens.",
+        description="Postagens do cliente, da mais recente para a mais antiga."
+    )
+    proximo_cursor: Optional[str] = Field(
+        None,
+        title="Cursor da próxima página.",
+        description="Valor a ser informado no parâmetro cursor para obter a próxima página. Nulo na última página."
+    )
+
+
+class FreightQuote(BaseModel):
+    indice: int = Field(
+        title="Índice da encomenda.",
+        description="Posição da encomenda na lista enviada.",
+        examples=[0]
+    )
+    transportadora: str = Field(
+        title="Transportadora.",
+        description="Transportadora utilizada no cálculo do frete.",
+        examples=["CORREIOS"]
+    )
+    volume: float = Field(
+        title="Volume da encomenda (em cm³).",
+        description="Volume calculado da encomenda (em cm³).",
+        examples=[500.0]
+    )
+    valor_frete: float = Field(
+        title="Valor do frete.",
+        description="Valor do frete calculado para a encomenda.",
+        examples=[23.6]
+    )
+    prazo_entrega: int = Field(
+        title="Prazo de entrega (em dias).",
+        description="Prazo estimado de entrega (em dias) da transportadora até a UF de destino.",
+        examples=[5]
+    )
+
+
+class FreightQuoteResponseWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP.",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta.",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: List[FreightQuote] = Field(
+        title="Cotações de frete.",
+        description="Cotação de cada encomenda, na mesma ordem do envio."
+    )
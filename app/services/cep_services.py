@@ -0,0 +1,82 @@
+import asyncio
+import json
+import logging
+from typing import Dict, Optional
+
+import brazilcep
+import redis.asyncio as redis
+from brazilcep.exceptions import CEPNotFound, InvalidCEP
+
+from app.core.cache import TTLCache
+from app.core.configs import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+_local_cache = TTLCache(maxsize=settings.CEP_CACHE_MAXSIZE, ttl=settings.CEP_CACHE_TTL)
+_in_flight: Dict[str, asyncio.Task] = {}
+
+
+class CepServices:
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    @staticmethod
+    def _redis_key(cep: str) -> str:
+        return f"cep:{cep}"
+
+    async def get_address(self, cep: str) -> Optional[Dict]:
+        address = _local_cache.get(cep, _MISSING)
+        if address is not _MISSING:
+            return address
+
+        try:
+            cached_address = await self.redis.get(self._redis_key(cep))
+        except redis.RedisError as e:
+            logger.warning("Falha ao consultar o cache de CEP no Redis. Erro: %s", e)
+            cached_address = None
+
+        if cached_address is not None:
+            address = json.loads(cached_address)
+            self._store_local(cep, address)
+            return address
+
+        task = _in_flight.get(cep)
+        if task is None:
+            task = asyncio.create_task(self._lookup(cep))
+            _in_flight[cep] = task
+            task.add_done_callback(lambda _: _in_flight.pop(cep, None))
+
+        return await asyncio.shield(task)
+
+    async def _lookup(self, cep: str) -> Optional[Dict]:
+        try:
+            address = await asyncio.wait_for(
+                asyncio.to_thread(brazilcep.get_address_from_cep, cep),
+                timeout=settings.CEP_LOOKUP_TIMEOUT
+            )
+        except (CEPNotFound, InvalidCEP):
+            address = None
+
+        self._store_local(cep, address)
+
+        try:
+            await self.redis.setex(
+                self._redis_key(cep),
+                settings.CEP_CACHE_TTL if address else settings.CEP_NEGATIVE_CACHE_TTL,
+                json.dumps(address)
+            )
+        except redis.RedisError as e:
+            logger.warning("Falha ao gravar o cache de CEP no Redis. Erro: %s", e)
+
+        return address
+
+    @staticmethod
+    def _store_local(cep: str, address: Optional[Dict]):
+        _local_cache.set(
+            cep,
+            address,
+            ttl=settings.CEP_CACHE_TTL if address else settings.CEP_NEGATIVE_CACHE_TTL
+        )
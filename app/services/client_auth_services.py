@@ -35,7 +35,7 @@ class ClientAuthServices:
             data_cadastro=datetime.now(tz=timezone("America/Sao_Paulo")),
             nome=client.nome.upper(),
             cpf_cnpj=client.cpf_cnpj,
-            client_secret=generate_client_secret_hash(client.client_secret)
+            client_secret=await generate_client_secret_hash(client.client_secret)
         )
 
         await client.initialize()
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from email.message import EmailMessage
+from time import perf_counter
+from typing import List, Optional
+
+import aiosmtplib
+
+from app.core.configs import settings
+from app.core.metrics import EMAIL_SEND_DURATION_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class _SmtpSession:
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.sent = 0
+
+
+class EmailDispatcher:
+    def __init__(
+            self,
+            hostname: str,
+            port: int,
+            username: Optional[str],
+            password: Optional[str],
+            use_tls: bool,
+            start_tls: Optional[bool],
+            pool_size: int,
+            max_messages_per_session: int,
+            timeout: float
+    ):
+        self.__hostname = hostname
+        self.__port = port
+        self.__username = username
+        self.__password = password
+        self.__use_tls = use_tls
+        self.__start_tls = start_tls
+        self.__max_messages_per_session = max_messages_per_session
+        self.__timeout = timeout
+        self.__slots = asyncio.Semaphore(pool_size)
+        self.__idle_sessions: List[_SmtpSession] = []
+
+    @property
+    def sender(self) -> Optional[str]:
+        return self.__username
+
+    async def __open_session(self) -> _SmtpSession:
+        client = aiosmtplib.SMTP(
+            hostname=self.__hostname,
+            port=self.__port,
+            timeout=self.__timeout,
+            use_tls=self.__use_tls,
+            start_tls=self.__start_tls
+        )
+        await client.connect()
+        if self.__username:
+            await client.login(self.__username, self.__password)
+
+        return _SmtpSession(client)
+
+    @staticmethod
+    async def __close_session(session: _SmtpSession):
+        try:
+            await session.client.quit()
+        except aiosmtplib.SMTPException:
+            session.client.close()
+
+    async def __acquire_session(self) -> _SmtpSession:
+        while self.__idle_sessions:
+            session = self.__idle_sessions.pop()
+            if session.client.is_connected and session.sent < self.__max_messages_per_session:
+                return session
+            await self.__close_session(session)
+
+        return await self.__open_session()
+
+    async def send(self, message: EmailMessage):
+        started_at = perf_counter()
+        try:
+            await self.__send(message)
+        except Exception:
+            EMAIL_SEND_DURATION_SECONDS.labels(result="error").observe(perf_counter() - started_at)
+            raise
+
+        EMAIL_SEND_DURATION_SECONDS.labels(result="success").observe(perf_counter() - started_at)
+
+    async def __send(self, message: EmailMessage):
+        async with self.__slots:
+            session = await self.__acquire_session()
+            try:
+                try:
+                    await session.client.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    logger.info("Sessão SMTP encerrada pelo servidor. Reabrindo a conexão.")
+                    session = await self.__open_session()
+                    await session.client.send_message(message)
+            except Exception:
+                session.client.close()
+                raise
+
+            session.sent += 1
+            self.__idle_sessions.append(session)
+
+    async def close(self):
+        while self.__idle_sessions:
+            await self.__close_session(self.__idle_sessions.pop())
+
+
+email_dispatcher = EmailDispatcher(
+    hostname=settings.SMTP_HOST,
+    port=settings.SMTP_PORT,
+    username=settings.SMTP_USER,
+    password=settings.SMTP_PASSWORD,
+    use_tls=settings.SMTP_USE_TLS,
+    start_tls=settings.SMTP_START_TLS,
+    pool_size=settings.SMTP_POOL_SIZE,
+    max_messages_per_session=settings.SMTP_MAX_MESSAGES_PER_SESSION,
+    timeout=settings.SMTP_TIMEOUT
+)
@@ -0,0 +1,83 @@
+import json
+import logging
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from app.core.configs import settings
+
+logger = logging.getLogger(__name__)
+
+RATE_FIELDS = (
+    "valor_base",
+    "peso_franquia",
+    "valor_kg_excedente",
+    "volume_franquia",
+    "volume_bloco",
+    "valor_bloco_excedente"
+)
+
+
+class FreightEngine:
+    def __init__(self, rates_path: str):
+        self.__rates_path = rates_path
+        self.__carrier_indexes: Dict[str, int] = {}
+        self.__rates: Optional[np.ndarray] = None
+
+    def load(self):
+        with open(self.__rates_path, encoding="utf-8") as file:
+            tables = json.load(file)
+
+        carriers = {carrier.upper(): rates for carrier, rates in tables.get("transportadoras", {}).items()}
+        rows = [tables["padrao"], *carriers.values()]
+
+        rates = np.array([[float(row[field]) for field in RATE_FIELDS] for row in rows], dtype=np.float64)
+        self.validate(rates, ["PADRAO", *carriers])
+
+        self.__rates = rates
+        self.__carrier_indexes = {carrier: index for index, carrier in enumerate(carriers, start=1)}
+        logger.info(
+            "Tabelas de frete carregadas de %s (%s transportadora(s) além da tabela padrão).",
+            self.__rates_path,
+            len(carriers)
+        )
+
+    @staticmethod
+    def validate(rates: np.ndarray, names: Sequence[str]):
+        invalid_rows, invalid_fields = np.nonzero(~np.isfinite(rates) | (rates < 0))
+        if invalid_rows.size:
+            raise ValueError(
+                f"Tabela de frete {names[invalid_rows[0]]} inválida: "
+                f"{RATE_FIELDS[invalid_fields[0]]} deve ser um número não negativo."
+            )
+
+        invalid_rows = np.flatnonzero(rates[:, RATE_FIELDS.index("volume_bloco")] <= 0)
+        if invalid_rows.size:
+            raise ValueError(
+                f"Tabela de frete {names[invalid_rows[0]]} inválida: volume_bloco deve ser maior que zero."
+            )
+
+    def carrier_indexes(self, transportadoras: Sequence[str]) -> np.ndarray:
+        return np.fromiter(
+            (self.__carrier_indexes.get(transportadora.upper(), 0) for transportadora in transportadoras),
+            dtype=np.intp,
+            count=len(transportadoras)
+        )
+
+    def quote(self, pesos: np.ndarray, volumes: np.ndarray, transportadoras: Sequence[str]) -> np.ndarray:
+        if self.__rates is None:
+            self.load()
+
+        rates = self.__rates[self.carrier_indexes(transportadoras)]
+        valor_base, peso_franquia, valor_kg, volume_franquia, volume_bloco, valor_bloco = rates.T
+
+        peso_excedente = np.maximum(pesos - peso_franquia, 0)
+        blocos_excedentes = np.floor_divide(np.maximum(volumes - volume_franquia, 0), volume_bloco)
+
+        return valor_base + peso_excedente * valor_kg + blocos_excedentes * valor_bloco
+
+    def quote_one(self, peso: float, volume: float, transportadora: str) -> float:
+        return float(self.quote(np.array([peso]), np.array([volume]), [transportadora])[0])
+
+
+freight_engine = FreightEngine(settings.FREIGHT_RATES_PATH)
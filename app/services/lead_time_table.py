@@ -0,0 +1,103 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.configs import settings
+from app.core.constants import UFS
+
+logger = logging.getLogger(__name__)
+
+_UF_INDEXES = {uf: index for index, uf in enumerate(UFS)}
+_UNKNOWN_UF = len(UFS)
+
+
+class LeadTimeTable:
+    def __init__(self, lead_times_path: str, reload_interval: float):
+        self.__lead_times_path = lead_times_path
+        self.__reload_interval = reload_interval
+        self.__table: Optional[Tuple[Dict[str, int], np.ndarray]] = None
+        self.__mtime: Optional[float] = None
+        self.__task: Optional[asyncio.Task] = None
+
+    def load(self):
+        mtime = os.stat(self.__lead_times_path).st_mtime
+        with open(self.__lead_times_path, encoding="utf-8") as file:
+            tables = json.load(file)
+
+        carriers = {carrier.upper(): table for carrier, table in tables.get("transportadoras", {}).items()}
+        lead_times = np.empty((len(carriers) + 1, len(UFS) + 1, len(UFS) + 1), dtype=np.int16)
+        lead_times[0] = tables["padrao"]
+
+        for carrier_index, table in enumerate(carriers.values(), start=1):
+            lead_times[carrier_index] = table.get("padrao", tables["padrao"])
+            for origin, destinations in table.get("prazos", {}).items():
+                for destination, days in destinations.items():
+                    lead_times[carrier_index, _UF_INDEXES[origin.upper()], _UF_INDEXES[destination.upper()]] = days
+
+        self.__table = ({carrier: index for index, carrier in enumerate(carriers, start=1)}, lead_times)
+        self.__mtime = mtime
+        logger.info(
+            "Prazos de entrega carregados de %s (%s transportadora(s) além do prazo padrão).",
+            self.__lead_times_path,
+            len(carriers)
+        )
+
+    def reload_if_changed(self):
+        try:
+            if os.stat(self.__lead_times_path).st_mtime != self.__mtime:
+                self.load()
+        except Exception as e:
+            logger.error("Falha ao recarregar os prazos de entrega de %s. Erro: %s", self.__lead_times_path, e)
+
+    def start(self):
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__watch())
+
+    async def stop(self):
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    async def __watch(self):
+        while True:
+            await asyncio.sleep(self.__reload_interval)
+            self.reload_if_changed()
+
+    def estimate(
+            self,
+            transportadoras: Sequence[str],
+            destinos: Sequence[Optional[str]],
+            origem: str = settings.ORIGIN_UF
+    ) -> np.ndarray:
+        if self.__table is None:
+            self.load()
+
+        carrier_indexes, lead_times = self.__table
+        carriers = np.fromiter(
+            (carrier_indexes.get(transportadora.upper(), 0) for transportadora in transportadoras),
+            dtype=np.intp,
+            count=len(transportadoras)
+        )
+        destinations = np.fromiter(
+            (_UF_INDEXES.get((destino or "").upper(), _UNKNOWN_UF) for destino in destinos),
+            dtype=np.intp,
+            count=len(destinos)
+        )
+
+        return lead_times[carriers, _UF_INDEXES.get(origem.upper(), _UNKNOWN_UF), destinations]
+
+    def estimate_one(self, transportadora: str, destino: Optional[str]) -> int:
+        return int(self.estimate([transportadora], [destino])[0])
+
+
+lead_time_table = LeadTimeTable(settings.LEAD_TIMES_PATH, settings.LEAD_TIMES_RELOAD_INTERVAL)
@@ -0,0 +1,79 @@
+import logging
+from email.message import EmailMessage
+from typing import Dict
+
+from app.core.configs import settings
+from app.services.email_dispatcher import EmailDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationServices:
+
+    def __init__(self, dispatcher: EmailDispatcher):
+        self.dispatcher = dispatcher
+
+    @staticmethod
+    async def handle_post_created(message: Dict):
+        logger.info(
+            "Postagem %s registrada na fila de criadas.",
+            message["data"]["id"],
+            extra={"sample_rate": settings.LOG_SAMPLE_RATE}
+        )
+
+    async def handle_post_on_course(self, message: Dict):
+        await self.send_email_on_course(
+            email=message["data"]["email"],
+            codigo_rastreamento=message["data"]["codigo_rastreamento"],
+            transportadora=message["data"]["transportadora"]
+        )
+
+    async def handle_post_delivered(self, message: Dict):
+        await self.send_email_delivered(
+            email=message["data"]["email"],
+            transportadora=message["data"]["transportadora"]
+        )
+
+    async def send_email_on_course(
+            self,
+            email: str,
+            codigo_rastreamento: str,
+            transportadora: str
+    ):
+        subject = "Seu pedido está em trânsito."
+        content = (
+            f"Olá,\n\n"
+            f"Sua encomenda foi enviada pela transportadora {transportadora} com o código de rastreamento ({codigo_rastreamento})!\n"
+            "Obrigado por utilizar nossos serviços.\n\n"
+            "Atenciosamente,\nSistema de Postagem."
+        )
+        return await self.send_email(email, subject, content)
+
+    async def send_email_delivered(
+            self,
+            email: str,
+            transportadora: str
+    ):
+        subject = "Seu pedido foi entregue."
+        content = (
+            f"Olá,\n\n"
+            f"Sua encomenda foi entregue pela transportadora {transportadora}!\n"
+            "Obrigado por utilizar nossos serviços.\n\n"
+            "Atenciosamente,\nSistema de Postagem."
+        )
+        return await self.send_email(email, subject, content)
+
+    async def send_email(self, email: str, subject: str, content: str):
+        message = EmailMessage()
+        message["From"] = self.dispatcher.sender
+        message["To"] = email
+        message["Subject"] = subject
+        message.set_content(content)
+
+        await self.dispatcher.send(message)
+        logger.info(
+            "E-mail '%s' enviado para %s.",
+            subject,
+            email,
+            extra={"sample_rate": settings.LOG_SAMPLE_RATE}
+        )
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from itertools import takewhile
+from typing import Optional
+
+from sqlalchemy import delete, func
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.future import select
+
+from app.core.configs import settings
+from app.core.database import engine
+from app.core.metrics import OUTBOX_MESSAGES_RELAYED_TOTAL, OUTBOX_RELAY_LAG_SECONDS
+from app.models.outbox_model import OutboxMessageModel
+from app.services.rabbitmq_publisher import RabbitmqPublisher, rabbitmq_publisher
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_RELAY_LOCK_ID = 7305011
+
+_outbox_table = OutboxMessageModel.__table__
+
+
+class OutboxRelay:
+    def __init__(self, db_engine: AsyncEngine, publisher: RabbitmqPublisher, batch_size: int, poll_interval: float):
+        self.__db_engine = db_engine
+        self.__publisher = publisher
+        self.__batch_size = batch_size
+        self.__poll_interval = poll_interval
+        self.__wakeup = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+
+    def notify(self):
+        self.__wakeup.set()
+
+    def start(self):
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self):
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    async def __run(self):
+        while True:
+            try:
+                async with self.__db_engine.connect() as connection:
+                    if await self.acquire_leadership(connection):
+                        try:
+                            await self.__relay(connection)
+                        finally:
+                            await self.release_leadership(connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Falha ao publicar as mensagens da outbox. Nova tentativa em %ss. Erro: %s",
+                    self.__poll_interval,
+                    e
+                )
+
+            await asyncio.sleep(self.__poll_interval)
+
+    async def __relay(self, connection: AsyncConnection):
+        while True:
+            relayed = await self.relay_batch(connection)
+            if relayed < self.__batch_size:
+                await self.__wait()
+
+    async def __wait(self):
+        try:
+            await asyncio.wait_for(self.__wakeup.wait(), timeout=self.__poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self.__wakeup.clear()
+
+    @staticmethod
+    async def acquire_leadership(connection: AsyncConnection) -> bool:
+        acquired = await connection.scalar(select(func.pg_try_advisory_lock(OUTBOX_RELAY_LOCK_ID)))
+        await connection.commit()
+        return acquired
+
+    @staticmethod
+    async def release_leadership(connection: AsyncConnection):
+        try:
+            await connection.rollback()
+            await connection.scalar(select(func.pg_advisory_unlock(OUTBOX_RELAY_LOCK_ID)))
+            await connection.commit()
+        except Exception:
+            await connection.invalidate()
+
+    async def relay_batch(self, connection: AsyncConnection) -> int:
+        query = await connection.execute(
+            select(_outbox_table).order_by(_outbox_table.c.id).limit(self.__batch_size)
+        )
+        outbox_messages = query.all()
+        await connection.commit()
+
+        if not outbox_messages:
+            return 0
+
+        errors = await self.__publisher.publish_batch([
+            (
+                outbox_message.routing_key,
+                self.__publisher.build_message(
+                    outbox_message.payload,
+                    outbox_message.correlation_id,
+                    outbox_message.criado_em
+                )
+            )
+            for outbox_message in outbox_messages
+        ])
+        confirmed = [
+            outbox_message
+            for outbox_message, _ in takewhile(lambda result: result[1] is None, zip(outbox_messages, errors))
+        ]
+
+        if confirmed:
+            await connection.execute(
+                delete(_outbox_table).where(
+                    _outbox_table.c.id.in_([outbox_message.id for outbox_message in confirmed])
+                )
+            )
+            await connection.commit()
+
+        confirmed_at = datetime.now(timezone.utc)
+        for outbox_message in confirmed:
+            OUTBOX_MESSAGES_RELAYED_TOTAL.labels(routing_key=outbox_message.routing_key).inc()
+            OUTBOX_RELAY_LAG_SECONDS.observe((confirmed_at - outbox_message.criado_em).total_seconds())
+
+        if len(confirmed) < len(outbox_messages):
+            raise RuntimeError(
+                f"Mensagem {outbox_messages[len(confirmed)].id} da outbox não confirmada pelo RabbitMQ. "
+                f"Erro: {errors[len(confirmed)]}"
+            )
+
+        return len(confirmed)
+
+
+outbox_relay = OutboxRelay(
+    db_engine=engine,
+    publisher=rabbitmq_publisher,
+    batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_RELAY_POLL_INTERVAL
+)
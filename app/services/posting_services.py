@@ -1,71 +1,217 @@
+import asyncio
+import base64
+import json
 from uuid import UUID, uuid4
 from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import brazilcep
+import numpy as np
 import redis.asyncio as redis
 from pytz import timezone
 from fastapi import status, Depends, HTTPException
+from pydantic import ValidationError
+from sqlalchemy import (
+    Integer,
+    String,
+    Text,
+    any_,
+    bindparam,
+    case,
+    column,
+    func,
+    insert,
+    literal,
+    tuple_,
+    union_all,
+    update,
+    values
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.configs import settings
+from app.core.logger import request_id_ctx
+from app.core.redis import get_redis
 from app.models.address_model import AddressModel
-from app.services.rabbitmq_publisher import RabbitmqPublisher
-from app.services.rabbitmq_consumer import RabbitmqConsumer
+from app.models.outbox_model import OutboxMessageModel
+from app.models.post_event_model import PostEventModel
+from app.services.cep_services import CepServices
+from app.services.freight_engine import freight_engine
+from app.services.lead_time_table import lead_time_table
+from app.services.outbox_relay import outbox_relay
+from app.services.rabbitmq_topology import CREATED_ROUTING_KEY, ON_COURSE_ROUTING_KEY, DELIVERED_ROUTING_KEY
+from app.services.tracking_cache import TrackingCache
 from app.models.posting_model import PostModel, PostStatus
-from app.core.database import get_session
+from app.core.database import Base, async_session, get_session
 from app.schemas.posting_schema import (
+    BatchPostResult,
+    BatchUpdatePostRequest,
     CreatePostRequest,
+    FreightQuoteRequest,
+    ParcelRequest,
     PostResponse,
     UpdatePostRequest
 )
 
+TRACKING_CODE_MAX_ATTEMPTS = 3
+
+POST_INFO_RESPONSE_PREFIX = b'{"status_code":200,"message":"Postagem retornada com sucesso.","data":'
+POST_INFO_RESPONSE_SUFFIX = b'}'
+
 
 class PostingServices:
 
-    def __init__(self, db: AsyncSession = Depends(get_session)):
+    def __init__(
+            self,
+            db: AsyncSession = Depends(get_session),
+            redis_client: redis.Redis = Depends(get_redis)
+    ):
         self.db = db
-        self.redis = redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            password=settings.REDIS_PASSWORD,
-            decode_responses=True
-        )
-
+        self.redis = redis_client
+        self.cep_services = CepServices(self.redis)
+        self.tracking_cache = TrackingCache(self.redis)
 
     @staticmethod
-    def rabbitmq_consumer(queue_name: str):
-        queue = queue_name
-        if not queue:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Configuração do RabbitMQ inválida. Verifique as variáveis de ambiente."
-            )
-        rabbitmq_consumer = RabbitmqConsumer(queue)
+    def _column_values(model: Base, exclude: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        return {
+            column.key: getattr(model, column.key)
+            for column in model.__table__.columns
+            if not column.primary_key and column.key not in exclude
+        }
 
-        return rabbitmq_consumer
+    async def insert_post(self, address: AddressModel, post: PostModel):
+        address_cte = (
+            insert(AddressModel)
+            .values(**self._column_values(address))
+            .returning(AddressModel.id)
+            .cte("endereco")
+        )
 
-    @staticmethod
-    def rabbitmq_publisher(exchange: str, routing_key: str, queue: str):
-        exchange, routing_key, queue = exchange, routing_key, queue
-        if not exchange or not routing_key or not queue:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Configuração do RabbitMQ inválida. Verifique as variáveis de ambiente."
+        for attempt in range(1, TRACKING_CODE_MAX_ATTEMPTS + 1):
+            post_cte = (
+                insert(PostModel)
+                .values(
+                    endereco_id=select(address_cte.c.id).scalar_subquery(),
+                    **self._column_values(post, exclude=("endereco_id",))
+                )
+                .add_cte(address_cte)
+                .returning(PostModel.id, PostModel.endereco_id)
+                .cte("postagem")
             )
-        rabbitmq_publisher = RabbitmqPublisher(exchange, routing_key, queue)
+            events_cte = (
+                insert(PostEventModel)
+                .from_select(
+                    ["postagem_id", "status_postagem", "ocorrido_em"],
+                    union_all(*(
+                        select(
+                            post_cte.c.id,
+                            literal(event.status_postagem, PostEventModel.status_postagem.type),
+                            literal(event.ocorrido_em, PostEventModel.ocorrido_em.type)
+                        )
+                        for event in post.eventos
+                    ))
+                )
+                .cte("eventos")
+            )
+            outbox_cte = (
+                insert(OutboxMessageModel)
+                .from_select(
+                    ["routing_key", "payload", "correlation_id"],
+                    select(
+                        literal(CREATED_ROUTING_KEY, String),
+                        func.jsonb_set(
+                            literal(self.post_created_message(post), JSONB),
+                            literal(["data", "id"], ARRAY(Text)),
+                            func.to_jsonb(post_cte.c.id)
+                        ),
+                        literal(request_id_ctx.get(), String)
+                    )
+                )
+                .cte("outbox")
+            )
+            statement = (
+                select(post_cte.c.id, post_cte.c.endereco_id)
+                .add_cte(events_cte)
+                .add_cte(outbox_cte)
+            )
+
+            try:
+                result = await self.db.execute(statement)
+                post.id, post.endereco_id = result.one()
+                await self.db.commit()
+                break
+            except IntegrityError as e:
+                await self.db.rollback()
+                if "codigo_rastreamento" not in str(e.orig) or attempt == TRACKING_CODE_MAX_ATTEMPTS:
+                    raise
+                post.codigo_rastreamento = uuid4()
 
-        return rabbitmq_publisher
+        address.id = post.endereco_id
+        post.endereco = address
 
-    async def create_new_post(self, post_data: CreatePostRequest, exchange: str, routing_key: str, queue: str) -> dict:
-        try:
-            address_returned = brazilcep.get_address_from_cep(post_data.endereco.cep)
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="CEP inválido ou não encontrado."
-            )
+    async def insert_posts(self, posts: List[Tuple[AddressModel, PostModel]]):
+        address_values = [self._column_values(address) for address, _ in posts]
 
+        for attempt in range(1, TRACKING_CODE_MAX_ATTEMPTS + 1):
+            try:
+                address_ids = (await self.db.execute(
+                    insert(AddressModel).returning(AddressModel.id, sort_by_parameter_order=True),
+                    address_values
+                )).scalars().all()
+
+                for address_id, (address, post) in zip(address_ids, posts):
+                    address.id = address_id
+                    post.endereco_id = address_id
+
+                post_ids = (await self.db.execute(
+                    insert(PostModel).returning(PostModel.id, sort_by_parameter_order=True),
+                    [self._column_values(post) for _, post in posts]
+                )).scalars().all()
+
+                for post_id, (_, post) in zip(post_ids, posts):
+                    post.id = post_id
+
+                await self.db.execute(
+                    insert(PostEventModel),
+                    [
+                        {
+                            "postagem_id": post.id,
+                            "status_postagem": event.status_postagem,
+                            "ocorrido_em": event.ocorrido_em
+                        }
+                        for _, post in posts
+                        for event in post.eventos
+                    ]
+                )
+
+                await self.db.execute(
+                    insert(OutboxMessageModel),
+                    [self.outbox_message(CREATED_ROUTING_KEY, self.post_created_message(post)) for _, post in posts]
+                )
+
+                await self.db.commit()
+                break
+            except IntegrityError as e:
+                await self.db.rollback()
+                if "codigo_rastreamento" not in str(e.orig) or attempt == TRACKING_CODE_MAX_ATTEMPTS:
+                    raise
+                for _, post in posts:
+                    post.codigo_rastreamento = uuid4()
+
+        for address, post in posts:
+            post.endereco = address
+
+    @staticmethod
+    def build_post(
+            post_data: CreatePostRequest,
+            address_returned: Dict,
+            current_time: datetime,
+            client_id: Optional[int],
+            valor_frete: float,
+            prazo_entrega: int
+    ) -> Tuple[AddressModel, PostModel]:
         address = AddressModel(
             cep=post_data.endereco.cep,
             cidade=address_returned.get("city").upper(),
@@ -73,78 +219,173 @@ class PostingServices:
             rua=address_returned.get("street").upper(),
             bairro=address_returned.get("district").upper(),
             numero=post_data.endereco.numero,
-            complemento=post_data.endereco.complemento.upper(),
+            complemento=post_data.endereco.complemento.upper() if post_data.endereco.complemento else None
         )
 
-        try:
-            self.db.add(address)
-            await self.db.commit()
-            await self.db.refresh(address)
-        except Exception as e:
-            await self.db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erro ao salvar o endereço. Tente novamente mais tarde. Erro: {e}"
-            )
-
-        current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
-
-        historico_atualizacoes = {
-            current_time.strftime("%d/%m/%Y %H:%M:%S"): PostStatus.CRIADO.value
-        }
-
-        while True:
-            codigo_rastreamento = uuid4()
-            query = await self.db.execute(
-                select(PostModel).where(PostModel.codigo_rastreamento == codigo_rastreamento)
-            )
-            existent_post = query.scalars().first()
-            if not existent_post:
-                break
-
         post = PostModel(
-            endereco_id=address.id,
+            client_id=client_id,
             email=post_data.email.upper(),
             peso=post_data.peso,
             altura=post_data.altura,
             largura=post_data.largura,
             comprimento=post_data.comprimento,
+            volume=post_data.altura * post_data.largura * post_data.comprimento,
+            valor_frete=valor_frete,
             transportadora=post_data.transportadora.upper(),
-            historico_atualizacoes=historico_atualizacoes,
+            eventos=[PostEventModel(status_postagem=PostStatus.CRIADO, ocorrido_em=current_time)],
             data_criacao=current_time,
             status_postagem=PostStatus.CRIADO,
-            previsao_entrega=current_time + timedelta(days=20),
-            codigo_rastreamento=codigo_rastreamento
+            previsao_entrega=current_time + timedelta(days=prazo_entrega),
+            codigo_rastreamento=uuid4()
+        )
+
+        return address, post
+
+    @staticmethod
+    def post_created_message(post: PostModel) -> Dict:
+        return {
+            "action": "post_created",
+            "data": {
+                "id": post.id,
+                "email": post.email,
+                "codigo_rastreamento": str(post.codigo_rastreamento),
+                "transportadora": post.transportadora
+            }
+        }
+
+    @staticmethod
+    def post_updated_message(post: PostModel) -> Dict:
+        return {
+            "action": "updated_post",
+            "data": {
+                "id": post.id,
+                "email": post.email,
+                "codigo_rastreamento": str(post.codigo_rastreamento),
+                "transportadora": post.transportadora,
+                "status_postagem": post.status_postagem.value
+            }
+        }
+
+    @staticmethod
+    def status_routing_key(status_postagem: PostStatus) -> str:
+        if status_postagem == PostStatus.EM_TRANSITO:
+            return ON_COURSE_ROUTING_KEY
+        return DELIVERED_ROUTING_KEY
+
+    @staticmethod
+    def status_transition_error(current_status: PostStatus, new_status: PostStatus) -> Optional[str]:
+        if new_status == PostStatus.CRIADO:
+            return "Requisição inválida. Não é possível alterar o status de uma postagem já criada para o status CRIADO."
+
+        if current_status == new_status:
+            return f"Requisição inválida. A postagem já se encontra com o status {current_status.value}."
+
+        if current_status == PostStatus.ENTREGUE and new_status == PostStatus.EM_TRANSITO:
+            return "Requisição inválida. Essa postagem já foi entregue ao destinatário."
+
+        if current_status == PostStatus.CRIADO and new_status == PostStatus.ENTREGUE:
+            return "Requisição inválida. Essa postagem ainda não passou pelo processo de entrega."
+
+        return None
+
+    @staticmethod
+    def outbox_message(routing_key: str, payload: Dict) -> Dict:
+        return {
+            "routing_key": routing_key,
+            "payload": payload,
+            "correlation_id": request_id_ctx.get()
+        }
+
+    @staticmethod
+    def parcel_arrays(parcels: List[ParcelRequest]) -> Tuple[np.ndarray, np.ndarray]:
+        dimensions = np.array(
+            [(parcel.peso, parcel.altura, parcel.largura, parcel.comprimento) for parcel in parcels],
+            dtype=np.float64
+        ).reshape(-1, 4)
+
+        return dimensions[:, 0], dimensions[:, 1] * dimensions[:, 2] * dimensions[:, 3]
+
+    def quote_freight(self, parcels: List[FreightQuoteRequest]) -> bytes:
+        if not parcels:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos uma encomenda."
+            )
+
+        if len(parcels) > settings.FREIGHT_QUOTE_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Limite de {settings.FREIGHT_QUOTE_MAX_SIZE} encomendas por requisição excedido."
+            )
+
+        transportadoras = [parcel.transportadora for parcel in parcels]
+        pesos, volumes = self.parcel_arrays(parcels)
+        valores_frete = freight_engine.quote(pesos, volumes, transportadoras)
+        prazos_entrega = lead_time_table.estimate(transportadoras, [parcel.uf_destino for parcel in parcels])
+
+        return json.dumps(
+            {
+                "status_code": status.HTTP_200_OK,
+                "message": f"Frete calculado para {len(parcels)} encomenda(s).",
+                "data": [
+                    {
+                        "indice": index,
+                        "transportadora": transportadora,
+                        "volume": volume,
+                        "valor_frete": valor_frete,
+                        "prazo_entrega": prazo_entrega
+                    }
+                    for index, (transportadora, volume, valor_frete, prazo_entrega) in enumerate(
+                        zip(transportadoras, volumes.tolist(), valores_frete.tolist(), prazos_entrega.tolist())
+                    )
+                ]
+            },
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode()
+
+    async def resolve_addresses(self, ceps: Set[str]) -> Dict[str, Optional[Dict]]:
+        ceps = list(ceps)
+        addresses = await asyncio.gather(
+            *(self.cep_services.get_address(cep) for cep in ceps),
+            return_exceptions=True
         )
 
-        post.volume = post_data.altura * post_data.largura * post_data.comprimento
+        return {
+            cep: None if isinstance(address, Exception) else address
+            for cep, address in zip(ceps, addresses)
+        }
 
-        valor_frete = 20
-        if post.peso > 5:
-            peso_excedente = post.peso - 5
-            valor_frete += peso_excedente * 2
+    async def create_new_post(self, post_data: CreatePostRequest, client_id: int) -> dict:
+        try:
+            address_returned = await self.cep_services.get_address(post_data.endereco.cep)
+        except Exception:
+            address_returned = None
 
-        if post.volume > 3000:
-            volume_excedente = post.volume - 3000
-            valor_frete += (volume_excedente // 500)
+        if not address_returned:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CEP inválido ou não encontrado."
+            )
 
-        post.valor_frete = valor_frete
+        current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
+        valor_frete = freight_engine.quote_one(
+            post_data.peso,
+            post_data.altura * post_data.largura * post_data.comprimento,
+            post_data.transportadora
+        )
+        prazo_entrega = lead_time_table.estimate_one(post_data.transportadora, address_returned.get("uf"))
+        address, post = self.build_post(
+            post_data,
+            address_returned,
+            current_time,
+            client_id,
+            valor_frete,
+            prazo_entrega
+        )
 
         try:
-            self.db.add(post)
-            await self.db.commit()
-            await self.db.refresh(post)
-
-            rabbitmq_publisher = self.rabbitmq_publisher(exchange, routing_key, queue)
-            await rabbitmq_publisher.send_message({
-                "action": "post_created",
-                "data": {
-                    "id": post.id,
-                    "email": post.email,
-                    "codigo_rastreamento": str(post.codigo_rastreamento),
-                    "transportadora": post.transportadora
-                }
-            })
+            await self.insert_post(address, post)
         except Exception as e:
             await self.db.rollback()
             raise HTTPException(
@@ -152,55 +393,263 @@ class PostingServices:
                 detail=f"Erro ao salvar no banco. Tente novamente mais tarde. Erro: {e}"
             )
 
+        outbox_relay.notify()
+        post_response = PostResponse.from_model(post)
+        await self.tracking_cache.set(str(post.codigo_rastreamento), post_response.model_dump_json())
+
         return {
             "status_code": status.HTTP_201_CREATED,
             "message": "Postagem criada com sucesso.",
-            "data": PostResponse.from_model(post)
+            "data": post_response
         }
 
-    async def get_post_info(self, tracking_code: UUID) -> dict:
-        cached_post = await self.redis.get(str(tracking_code))
+    @staticmethod
+    def validate_post_data(post_data: Any) -> Tuple[Optional[CreatePostRequest], Optional[Tuple[int, str]]]:
+        try:
+            return CreatePostRequest.model_validate(post_data), None
+        except HTTPException as e:
+            return None, (e.status_code, e.detail)
+        except ValidationError as e:
+            error = e.errors()[0]
+            campo = ".".join(str(location) for location in error["loc"]) or "postagem"
+            return None, (status.HTTP_422_UNPROCESSABLE_ENTITY, f"Parâmetro inválido ({campo}): {error['msg']}")
+        except Exception:
+            return None, (status.HTTP_422_UNPROCESSABLE_ENTITY, "Parâmetros inválidos.")
 
-        if cached_post:
-            return {
-                "status_code": status.HTTP_200_OK,
-                "message": "Postagem retornada com sucesso.",
-                "data": PostResponse.model_validate_json(cached_post)
-            }
+    async def create_new_posts(self, raw_posts_data: List[Any], client_id: int) -> dict:
+        if not raw_posts_data:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos uma postagem."
+            )
 
-        query = await self.db.execute(
-            select(PostModel).where(
-                PostModel.codigo_rastreamento == tracking_code
+        if len(raw_posts_data) > settings.POSTING_BATCH_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Limite de {settings.POSTING_BATCH_MAX_SIZE} postagens por requisição excedido."
             )
+
+        results: List[Optional[BatchPostResult]] = [None] * len(raw_posts_data)
+        posts_data: List[CreatePostRequest] = []
+        posts_indexes: List[int] = []
+
+        for index, raw_post_data in enumerate(raw_posts_data):
+            post_data, error = self.validate_post_data(raw_post_data)
+            if error:
+                results[index] = BatchPostResult(indice=index, status_code=error[0], message=error[1])
+                continue
+
+            posts_data.append(post_data)
+            posts_indexes.append(index)
+
+        addresses = await self.resolve_addresses({post_data.endereco.cep for post_data in posts_data})
+        current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
+        pesos, volumes = self.parcel_arrays(posts_data)
+        transportadoras = [post_data.transportadora for post_data in posts_data]
+        valores_frete = freight_engine.quote(pesos, volumes, transportadoras)
+        prazos_entrega = lead_time_table.estimate(
+            transportadoras,
+            [(addresses[post_data.endereco.cep] or {}).get("uf") for post_data in posts_data]
+        )
+
+        posts: List[Tuple[AddressModel, PostModel]] = []
+        indexes: List[int] = []
+
+        for position, (index, post_data) in enumerate(zip(posts_indexes, posts_data)):
+            address_returned = addresses[post_data.endereco.cep]
+            if not address_returned:
+                results[index] = BatchPostResult(
+                    indice=index,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="CEP inválido ou não encontrado."
+                )
+                continue
+
+            posts.append(
+                self.build_post(
+                    post_data,
+                    address_returned,
+                    current_time,
+                    client_id,
+                    float(valores_frete[position]),
+                    int(prazos_entrega[position])
+                )
+            )
+            indexes.append(index)
+
+        if posts:
+            try:
+                await self.insert_posts(posts)
+            except Exception as e:
+                await self.db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Erro ao salvar no banco. Tente novamente mais tarde. Erro: {e}"
+                )
+
+            outbox_relay.notify()
+
+        post_responses = [PostResponse.from_model(post) for _, post in posts]
+        await self.tracking_cache.set_many(
+            (str(post_response.codigo_rastreamento), post_response.model_dump_json())
+            for post_response in post_responses
         )
-        post_found = query.scalars().first()
+
+        for index, post_response in zip(indexes, post_responses):
+            results[index] = BatchPostResult(
+                indice=index,
+                status_code=status.HTTP_201_CREATED,
+                message="Postagem criada com sucesso.",
+                data=post_response
+            )
+
+        failed = len(raw_posts_data) - len(posts)
+
+        return {
+            "status_code": status.HTTP_207_MULTI_STATUS if failed else status.HTTP_201_CREATED,
+            "message": f"{len(posts)} postagem(ns) criada(s) e {failed} com falha.",
+            "data": results
+        }
+
+    @staticmethod
+    async def load_post_json(tracking_code: UUID) -> Optional[str]:
+        async with async_session() as session:
+            query = await session.execute(
+                select(PostModel).where(
+                    PostModel.codigo_rastreamento == tracking_code
+                )
+            )
+            post_found = query.scalars().first()
 
         if not post_found:
+            return None
+
+        return PostResponse.from_model(post_found).model_dump_json()
+
+    async def get_post_info(self, tracking_code: UUID) -> bytes:
+        post_json = await self.tracking_cache.get_or_load(
+            str(tracking_code),
+            lambda: self.load_post_json(tracking_code)
+        )
+
+        if not post_json:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Não foram encontradas postagens com o código de rastreamento informado."
             )
 
-        await self.redis.setex(
-            str(tracking_code),
-            300,
-            PostResponse.from_model(post_found).model_dump_json()
+        return POST_INFO_RESPONSE_PREFIX + post_json.encode() + POST_INFO_RESPONSE_SUFFIX
+
+    async def load_posts_json(self, tracking_codes: List[str]) -> Dict[str, str]:
+        query = await self.db.execute(
+            select(PostModel).where(
+                PostModel.codigo_rastreamento == any_(
+                    bindparam(
+                        "codigos_rastreamento",
+                        [UUID(tracking_code) for tracking_code in tracking_codes],
+                        type_=ARRAY(PG_UUID(as_uuid=True))
+                    )
+                )
+            )
         )
 
         return {
-            "status_code": status.HTTP_200_OK,
-            "message": "Postagem retornada com sucesso.",
-            "data": PostResponse.from_model(post_found)
+            str(post.codigo_rastreamento): PostResponse.from_model(post).model_dump_json()
+            for post in query.scalars().all()
         }
 
-    async def update_post(
+    async def get_posts_info(self, tracking_codes: List[UUID]) -> bytes:
+        if not tracking_codes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe ao menos um código de rastreamento."
+            )
+
+        if len(tracking_codes) > settings.POST_INFO_BATCH_MAX_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Limite de {settings.POST_INFO_BATCH_MAX_SIZE} códigos de rastreamento por requisição excedido."
+            )
+
+        tracking_codes = list(dict.fromkeys(str(tracking_code) for tracking_code in tracking_codes))
+        posts_json = await self.tracking_cache.get_many(tracking_codes)
+
+        misses = [tracking_code for tracking_code in tracking_codes if tracking_code not in posts_json]
+        if misses:
+            loaded_posts = await self.load_posts_json(misses)
+            if loaded_posts:
+                posts_json.update(loaded_posts)
+                await self.tracking_cache.set_many(loaded_posts.items())
+
+        found = [posts_json[tracking_code] for tracking_code in tracking_codes if tracking_code in posts_json]
+        not_found = [tracking_code for tracking_code in tracking_codes if tracking_code not in posts_json]
+
+        header = json.dumps(
+            {
+                "status_code": status.HTTP_200_OK,
+                "message": f"{len(found)} postagem(ns) encontrada(s) e {len(not_found)} não encontrada(s)."
+            },
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+
+        return b"".join((
+            header[:-1].encode(),
+            b',"data":[',
+            ",".join(found).encode(),
+            b'],"nao_encontrados":',
+            json.dumps(not_found).encode(),
+            b"}"
+        ))
+
+    @staticmethod
+    def encode_cursor(post: PostModel) -> str:
+        cursor = json.dumps({"data_criacao": post.data_criacao.isoformat(), "id": post.id})
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            decoded_cursor = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(decoded_cursor["data_criacao"]), int(decoded_cursor["id"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor de paginação inválido."
+            )
+
+    async def list_posts(
             self,
-            post_id: int,
-            updated_post: UpdatePostRequest,
-            exchange: str,
-            routing_key: str,
-            publish_queue: str
+            client_id: int,
+            limit: int,
+            cursor: Optional[str],
+            status_postagem: Optional[PostStatus]
     ) -> dict:
+        query = select(PostModel).where(PostModel.client_id == client_id)
+
+        if status_postagem:
+            query = query.where(PostModel.status_postagem == status_postagem)
+
+        if cursor:
+            data_criacao, post_id = self.decode_cursor(cursor)
+            query = query.where(tuple_(PostModel.data_criacao, PostModel.id) < tuple_(data_criacao, post_id))
+
+        result = await self.db.execute(
+            query.order_by(PostModel.data_criacao.desc(), PostModel.id.desc()).limit(limit + 1)
+        )
+        posts_found = result.scalars().all()
+
+        has_next_page = len(posts_found) > limit
+        posts_found = posts_found[:limit]
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "message": f"{len(posts_found)} postagem(ns) retornada(s).",
+            "data": [PostResponse.from_model(post) for post in posts_found],
+            "proximo_cursor": self.encode_cursor(posts_found[-1]) if has_next_page else None
+        }
+
+    async def update_post(self, post_id: int, updated_post: UpdatePostRequest) -> dict:
         query = await self.db.execute(
             select(PostModel).where(PostModel.id == post_id)
         )
@@ -212,57 +661,185 @@ class PostingServices:
                 detail="Não foram encontradas postagens com o ID informado."
             )
 
-        if str(updated_post.status_postagem.value) == "CRIADO":
+        transition_error = self.status_transition_error(existent_post.status_postagem, updated_post.status_postagem)
+        if transition_error:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Requisição inválida. Não é possível alterar o status de uma postagem já criada para o status CRIADO."
+                detail=transition_error
             )
 
-        if str(existent_post.status_postagem.value) == str(updated_post.status_postagem.value):
+        existent_post.status_postagem = updated_post.status_postagem
+        current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
+        existent_post.eventos.append(
+            PostEventModel(status_postagem=updated_post.status_postagem, ocorrido_em=current_time)
+        )
+
+        if updated_post.status_postagem == PostStatus.EM_TRANSITO:
+            existent_post.data_envio = current_time
+        else:
+            existent_post.data_entrega = current_time
+
+        try:
+            self.db.add(existent_post)
+            self.db.add(OutboxMessageModel(**self.outbox_message(
+                self.status_routing_key(existent_post.status_postagem),
+                self.post_updated_message(existent_post)
+            )))
+            await self.db.commit()
+            await self.db.refresh(existent_post)
+        except Exception as e:
+            await self.db.rollback()
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Requisição inválida. A postagem já se encontra com o status {existent_post.status_postagem.value}."
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Erro: {e}"
             )
 
-        if str(existent_post.status_postagem.value) == "ENTREGUE" and str(updated_post.status_postagem.value) == "EM_TRANSITO":
+        outbox_relay.notify()
+
+        post_response = PostResponse.from_model(existent_post)
+        await self.tracking_cache.set(
+            str(existent_post.codigo_rastreamento),
+            post_response.model_dump_json(),
+            invalidate=True
+        )
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "message": "Postagem atualizada com sucesso.",
+            "data": post_response
+        }
+
+    async def update_posts(self, updates: List[BatchUpdatePostRequest]) -> dict:
+        if not updates:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Requisição inválida. Essa postagem já foi entregue ao destinatário."
+                detail="Informe ao menos uma atualização."
             )
 
-        if str(existent_post.status_postagem.value) == "CRIADO" and str(updated_post.status_postagem.value) == "ENTREGUE":
+        if len(updates) > settings.POSTING_UPDATE_BATCH_MAX_SIZE:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Requisição inválida. Essa postagem ainda não passou pelo processo de entrega."
+                detail=f"Limite de {settings.POSTING_UPDATE_BATCH_MAX_SIZE} atualizações por requisição excedido."
             )
 
-        existent_post.status_postagem = updated_post.status_postagem
-        current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
-        current_time_as_str = current_time.strftime("%d/%m/%Y %H:%M:%S")
+        query = await self.db.execute(
+            select(PostModel.id, PostModel.status_postagem).where(
+                PostModel.id == any_(
+                    bindparam(
+                        "post_ids",
+                        list({update_data.post_id for update_data in updates}),
+                        type_=ARRAY(Integer)
+                    )
+                )
+            )
+        )
+        current_statuses = dict(query.all())
+
+        results: List[Optional[BatchPostResult]] = [None] * len(updates)
+        pending: Dict[int, Tuple[int, PostStatus, PostStatus]] = {}
+        seen_post_ids: Set[int] = set()
+
+        for index, update_data in enumerate(updates):
+            current_status = current_statuses.get(update_data.post_id)
+            if current_status is None:
+                results[index] = BatchPostResult(
+                    indice=index,
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    message="Não foram encontradas postagens com o ID informado."
+                )
+                continue
 
-        new_historic = dict(existent_post.historico_atualizacoes)
-        new_historic[current_time_as_str] = updated_post.status_postagem.value
-        existent_post.historico_atualizacoes = new_historic
+            if update_data.post_id in seen_post_ids:
+                results[index] = BatchPostResult(
+                    indice=index,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Requisição inválida. A postagem foi informada mais de uma vez."
+                )
+                continue
+            seen_post_ids.add(update_data.post_id)
+
+            transition_error = self.status_transition_error(current_status, update_data.status_postagem)
+            if transition_error:
+                results[index] = BatchPostResult(
+                    indice=index,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message=transition_error
+                )
+                continue
+
+            pending[update_data.post_id] = (index, current_status, update_data.status_postagem)
+
+        updated_rows = []
+        if pending:
+            current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
+            updates_values = values(
+                column("id", Integer),
+                column("status_anterior", PostModel.status_postagem.type),
+                column("status_postagem", PostModel.status_postagem.type),
+                name="atualizacoes"
+            ).data([
+                (post_id, current_status, new_status)
+                for post_id, (_, current_status, new_status) in pending.items()
+            ])
 
-        if updated_post.status_postagem == PostStatus.EM_TRANSITO:
-            existent_post.data_envio = current_time
             try:
-                consumer = self.rabbitmq_consumer("created_queue")
-                await consumer.consume_messages_created_queue(post_id)
-
-                rabbitmq_publisher = self.rabbitmq_publisher(exchange, routing_key, publish_queue)
-                await rabbitmq_publisher.send_message({
-                    "action": "updated_post",
-                    "data": {
-                        "id": existent_post.id,
-                        "email": existent_post.email,
-                        "transportadora": existent_post.transportadora
-                    }
-                })
+                query = await self.db.execute(
+                    update(PostModel)
+                    .where(
+                        PostModel.id == updates_values.c.id,
+                        PostModel.status_postagem == updates_values.c.status_anterior
+                    )
+                    .values(
+                        status_postagem=updates_values.c.status_postagem,
+                        data_envio=case(
+                            (
+                                updates_values.c.status_postagem == PostStatus.EM_TRANSITO,
+                                literal(current_time, PostModel.data_envio.type)
+                            ),
+                            else_=PostModel.data_envio
+                        ),
+                        data_entrega=case(
+                            (
+                                updates_values.c.status_postagem == PostStatus.ENTREGUE,
+                                literal(current_time, PostModel.data_entrega.type)
+                            ),
+                            else_=PostModel.data_entrega
+                        )
+                    )
+                    .returning(
+                        PostModel.id,
+                        PostModel.email,
+                        PostModel.codigo_rastreamento,
+                        PostModel.transportadora,
+                        PostModel.status_postagem
+                    )
+                )
+                updated_rows = query.all()
+
+                if updated_rows:
+                    await self.db.execute(
+                        insert(PostEventModel),
+                        [
+                            {
+                                "postagem_id": row.id,
+                                "status_postagem": row.status_postagem,
+                                "ocorrido_em": current_time
+                            }
+                            for row in updated_rows
+                        ]
+                    )
+                    await self.db.execute(
+                        insert(OutboxMessageModel),
+                        [
+                            self.outbox_message(
+                                self.status_routing_key(row.status_postagem),
+                                self.post_updated_message(row)
+                            )
+                            for row in updated_rows
+                        ]
+                    )
 
-                self.db.add(existent_post)
                 await self.db.commit()
-                await self.db.refresh(existent_post)
             except Exception as e:
                 await self.db.rollback()
                 raise HTTPException(
@@ -270,32 +847,47 @@ class PostingServices:
                     detail=f"Erro: {e}"
                 )
 
-        if updated_post.status_postagem == PostStatus.ENTREGUE:
-            existent_post.data_entrega = current_time
-            try:
-                consumer = self.rabbitmq_consumer("on_course_queue")
-                await consumer.consume_messages_on_course_queue(post_id)
+        if updated_rows:
+            outbox_relay.notify()
 
-                self.db.add(existent_post)
-                await self.db.commit()
-                await self.db.refresh(existent_post)
-            except Exception as e:
-                await self.db.rollback()
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Erro: {e}"
+            query = await self.db.execute(
+                select(PostModel).where(
+                    PostModel.id == any_(
+                        bindparam("post_ids", [row.id for row in updated_rows], type_=ARRAY(Integer))
+                    )
                 )
-
-        cached_post = await self.redis.get(str(existent_post.codigo_rastreamento))
-        if cached_post:
-            await self.redis.setex(
-                str(existent_post.codigo_rastreamento),
-                300,
-                PostResponse.from_model(existent_post).model_dump_json()
+            )
+            post_responses = {post.id: PostResponse.from_model(post) for post in query.scalars().all()}
+            await self.tracking_cache.set_many(
+                (
+                    (str(post_response.codigo_rastreamento), post_response.model_dump_json())
+                    for post_response in post_responses.values()
+                ),
+                invalidate=True
             )
 
+            for row in updated_rows:
+                index = pending[row.id][0]
+                results[index] = BatchPostResult(
+                    indice=index,
+                    status_code=status.HTTP_200_OK,
+                    message="Postagem atualizada com sucesso.",
+                    data=post_responses.get(row.id)
+                )
+
+        for index, _, _ in pending.values():
+            if results[index] is None:
+                results[index] = BatchPostResult(
+                    indice=index,
+                    status_code=status.HTTP_409_CONFLICT,
+                    message="O status da postagem foi alterado por outra requisição. Tente novamente."
+                )
+
+        updated = len(updated_rows)
+        failed = len(updates) - updated
+
         return {
-            "status_code": status.HTTP_200_OK,
-            "message": "Postagem atualizada com sucesso.",
-            "data": PostResponse.from_model(existent_post)
+            "status_code": status.HTTP_207_MULTI_STATUS if failed else status.HTTP_200_OK,
+            "message": f"{updated} postagem(ns) atualizada(s) e {failed} com falha.",
+            "data": results
         }
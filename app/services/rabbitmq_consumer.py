@@ -1,169 +1,138 @@
 import json
-from email.message import EmailMessage
-from os import environ
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
 
-import aiosmtplib
 import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractRobustConnection
 
 from app.core.configs import settings
+from app.core.logger import request_id_ctx
+from app.core.metrics import NOTIFICATION_MESSAGE_LAG_SECONDS, NOTIFICATION_MESSAGES_TOTAL, NOTIFICATION_QUEUE_DEPTH
+from app.services.rabbitmq_topology import (
+    DEAD_LETTER_EXCHANGE,
+    RETRY_COUNT_HEADER,
+    RETRY_EXCHANGE,
+    declare_topology,
+    retry_queue_name
+)
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Dict], Awaitable[None]]
 
 
 class RabbitmqConsumer:
-    def __init__(self, queue: str):
-        self.__host = settings.RABBITMQ_HOST
-        self.__port = settings.RABBITMQ_PORT
-        self.__username = settings.RABBITMQ_DEFAULT_USER
-        self.__password = settings.RABBITMQ_DEFAULT_PASS
+    def __init__(self, queue: str, handler: MessageHandler, prefetch_count: int):
         self.__queue = queue
-        self.__connection = None
-        self.__channel = None
+        self.__handler = handler
+        self.__prefetch_count = prefetch_count
+        self.__channel: Optional[AbstractChannel] = None
+        self.__consumer_tag: Optional[str] = None
+
+    async def start(self, connection: AbstractRobustConnection):
+        self.__channel = await connection.channel()
+        await self.__channel.set_qos(prefetch_count=self.__prefetch_count)
+        await declare_topology(self.__channel)
+
+        queue = await self.__channel.get_queue(self.__queue)
+        self.__consumer_tag = await queue.consume(self.__on_message)
+        logger.info(
+            "Consumindo a fila '%s' com até %s mensagens simultâneas.",
+            self.__queue,
+            self.__prefetch_count
+        )
 
-    async def __connect(self):
-        url = f"amqp://{self.__username}:{self.__password}@{self.__host}:{self.__port}/"
-        print(f"Conectando ao RabbitMQ: {url}")
-        self.__connection = await aio_pika.connect_robust(url)
-        self.__channel = await self.__connection.channel()
-        print(f"Conexão estabelecida e canal criado para a fila '{self.__queue}'.")
-
-    async def __close_connection(self):
-        if self.__connection:
-            await self.__connection.close()
-            print("Conexão com RabbitMQ encerrada.")
-
-    async def consume_messages_created_queue(self, post_id: int):
-        if not self.__connection or self.__connection.is_closed:
-            await self.__connect()
-
-        queue = await self.__channel.declare_queue(self.__queue, durable=True)
-
-        async for message in queue:
-            message_body = message.body.decode()
-            json_msg = json.loads(message_body)
-
-            id_from_queue = json_msg["data"]["id"]
-
-            if id_from_queue == post_id:
-                email = json_msg["data"]["email"]
-                codigo_rastreamento = json_msg["data"]["codigo_rastreamento"]
-                transportadora = json_msg["data"]["transportadora"]
-
-                try:
-                    await self.send_email_on_course(
-                        email=email,
-                        codigo_rastreamento=codigo_rastreamento,
-                        transportadora=transportadora
-                    )
-
-                    await message.ack()
-                    print(f"Mensagem {message.body} processada com sucesso.")
-                except aiosmtplib.SMTPException as e:
-                    print(f"Falha no envio do e-mail para {email} (SMTP). Erro: {e}. A mensagem não será confirmada.")
-                    await message.nack(requeue=True)
-                except json.JSONDecodeError as e:
-                    print(f"Erro ao decodificar a mensagem JSON. Erro: {e}")
-                    await message.nack(requeue=False)
-                except Exception as e:
-                    print(f"Erro inesperado. Erro: {e}. A mensagem não será confirmada.")
-                    await message.nack(requeue=True)
-                finally:
-                    await self.__close_connection()
-                    break
-
-    async def consume_messages_on_course_queue(self, post_id: int):
-        if not self.__connection or self.__connection.is_closed:
-            await self.__connect()
-
-        queue = await self.__channel.declare_queue(self.__queue, durable=True)
-
-        async for message in queue:
-            message_body = message.body.decode()
-            json_msg = json.loads(message_body)
-
-            id_from_queue = json_msg["data"]["id"]
-
-            if id_from_queue == post_id:
-                email = json_msg["data"]["email"]
-                transportadora = json_msg["data"]["transportadora"]
-
-                try:
-                    await self.send_email_delivered(
-                        email=email,
-                        transportadora=transportadora
-                    )
-                    await message.ack()
-                    print(f"Mensagem {message.body} processada com sucesso.")
-                except aiosmtplib.SMTPException as e:
-                    print(f"Falha no envio do e-mail para {email} (SMTP). Erro: {e}. A mensagem não será confirmada.")
-                    await message.nack(requeue=True)
-                except json.JSONDecodeError as e:
-                    print(f"Erro ao decodificar a mensagem JSON. Erro: {e}")
-                    await message.nack(requeue=False)
-                except Exception as e:
-                    print(f"Erro inesperado. Erro: {e}. A mensagem não será confirmada.")
-                    await message.nack(requeue=True)
-                finally:
-                    await self.__close_connection()
-                    break
-
-    async def send_email_on_course(
-            self,
-            email: str,
-            codigo_rastreamento: str,
-            transportadora: str
-    ):
-        subject = "Seu pedido está em trânsito."
-        content = (
-            f"Olá,\n\n"
-            f"Sua encomenda foi enviada pela transportadora {transportadora} com o código de rastreamento ({codigo_rastreamento})!\n"
-            "Obrigado por utilizar nossos serviços.\n\n"
-            "Atenciosamente,\nSistema de Postagem."
+    async def refresh_queue_depth(self):
+        if not self.__channel or self.__channel.is_closed:
+            return
+
+        queue = await self.__channel.declare_queue(self.__queue, passive=True)
+        NOTIFICATION_QUEUE_DEPTH.labels(queue=self.__queue).set(queue.declaration_result.message_count)
+
+    async def stop(self):
+        if self.__channel and not self.__channel.is_closed:
+            if self.__consumer_tag:
+                queue = await self.__channel.get_queue(self.__queue, ensure=False)
+                await queue.cancel(self.__consumer_tag)
+            await self.__channel.close()
+
+        self.__channel = None
+        self.__consumer_tag = None
+
+    async def __on_message(self, message: AbstractIncomingMessage):
+        request_id_ctx.set(message.correlation_id)
+
+        if message.timestamp:
+            published_at = message.timestamp
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc)
+            NOTIFICATION_MESSAGE_LAG_SECONDS.labels(queue=self.__queue).observe(
+                max((datetime.now(timezone.utc) - published_at).total_seconds(), 0)
+            )
+
+        try:
+            json_msg = json.loads(message.body.decode())
+            await self.__handler(json_msg)
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.error("Mensagem inválida na fila '%s'. Erro: %s", self.__queue, e)
+            NOTIFICATION_MESSAGES_TOTAL.labels(queue=self.__queue, result="invalid").inc()
+            await self.__dead_letter(message, e)
+        except Exception as e:
+            NOTIFICATION_MESSAGES_TOTAL.labels(queue=self.__queue, result="error").inc()
+            await self.__retry_or_dead_letter(message, e)
+        else:
+            NOTIFICATION_MESSAGES_TOTAL.labels(queue=self.__queue, result="success").inc()
+            await message.ack()
+
+    async def __retry_or_dead_letter(self, message: AbstractIncomingMessage, error: Exception):
+        retries = int(message.headers.get(RETRY_COUNT_HEADER, 0))
+
+        if retries >= settings.NOTIFICATION_MAX_RETRIES:
+            logger.error(
+                "Mensagem da fila '%s' falhou após %s tentativas. Enviando para a dead-letter. Erro: %s",
+                self.__queue,
+                retries,
+                error
+            )
+            await self.__dead_letter(message, error)
+            return
+
+        logger.warning(
+            "Falha ao processar mensagem da fila '%s' (tentativa %s/%s). Erro: %s",
+            self.__queue,
+            retries + 1,
+            settings.NOTIFICATION_MAX_RETRIES,
+            error
         )
-        return await self.send_email(email, subject, content)
+        await self.__republish(message, RETRY_EXCHANGE, retry_queue_name(self.__queue, retries), retries + 1, error)
+
+    async def __dead_letter(self, message: AbstractIncomingMessage, error: Exception):
+        retries = int(message.headers.get(RETRY_COUNT_HEADER, 0))
+        await self.__republish(message, DEAD_LETTER_EXCHANGE, self.__queue, retries, error)
 
-    async def send_email_delivered(
+    async def __republish(
             self,
-            email: str,
-            transportadora: str
+            message: AbstractIncomingMessage,
+            exchange_name: str,
+            routing_key: str,
+            retries: int,
+            error: Exception
     ):
-        subject = "Seu pedido foi entregue."
-        content = (
-            f"Olá,\n\n"
-            f"Sua encomenda foi entregue pela transportadora {transportadora}!\n"
-            "Obrigado por utilizar nossos serviços.\n\n"
-            "Atenciosamente,\nSistema de Postagem."
+        exchange = await self.__channel.get_exchange(exchange_name, ensure=False)
+        await exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                content_type=message.content_type,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                timestamp=datetime.now(timezone.utc),
+                correlation_id=message.correlation_id,
+                headers={
+                    **message.headers,
+                    RETRY_COUNT_HEADER: retries,
+                    "x-last-error": str(error)[:256]
+                }
+            ),
+            routing_key=routing_key
         )
-        return await self.send_email(email, subject, content)
-
-    @staticmethod
-    async def send_email(email: str, subject: str, content: str):
-        print(f"Preparando para enviar o e-mail para {email} com o assunto: {subject}")
-        smtp_user = environ.get("SMTP_USER")
-        smtp_password = environ.get("SMTP_PASSWORD")
-        smtp_host = environ.get("SMTP_HOST")
-        smtp_port = int(environ.get("SMTP_PORT", 587))
-
-        message = EmailMessage()
-        message["From"] = smtp_user
-        message["To"] = email
-        message["Subject"] = subject
-        message.set_content(content)
-
-        max_retries = 3
-        attempt = 1
-
-        while attempt <= max_retries:
-            try:
-                print(f"Tentando enviar o e-mail... Tentativa {attempt}/{max_retries}")
-                async with aiosmtplib.SMTP(hostname=smtp_host, port=smtp_port, timeout=10) as client:
-                    await client.login(smtp_user, smtp_password)
-                    await client.send_message(message)
-                    break
-            except aiosmtplib.SMTPException as e:
-                print(f"Falha ao enviar e-mail (Tentativa {attempt}/{max_retries}): {e}")
-            except Exception as e:
-                print(f"Ocorreu um erro inesperado (Tentativa {attempt}/{max_retries}): {e}")
-
-            attempt += 1
-
-        if attempt > max_retries:
-            print(f"Máximo de tentativas alcançado. Falha ao enviar e-mail para {email}.")
+        await message.ack()
@@ -1,83 +1,117 @@
+import asyncio
 import json
-from typing import Dict
+import logging
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
 
 import aio_pika
-from fastapi import HTTPException, status
+from aio_pika.abc import AbstractRobustChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
 
 from app.core.configs import settings
+from app.core.metrics import (
+    RABBITMQ_PUBLISH_BATCH_SIZE,
+    RABBITMQ_PUBLISH_DURATION_SECONDS,
+    RABBITMQ_PUBLISH_ERRORS_TOTAL
+)
+from app.services.rabbitmq_topology import POST_EXCHANGE, declare_topology
+
+logger = logging.getLogger(__name__)
 
 
 class RabbitmqPublisher:
-    def __init__(self, exchange: str, routing_key: str, queue: str):
-        self.__host = settings.RABBITMQ_HOST
-        self.__port = settings.RABBITMQ_PORT
-        self.__username = settings.RABBITMQ_DEFAULT_USER
-        self.__password = settings.RABBITMQ_DEFAULT_PASS
+    def __init__(self, exchange: str, pool_size: int):
+        self.__url = settings.RABBITMQ_URL
         self.__exchange = exchange
-        self.__routing_key = routing_key
-        self.__queue = queue
-        self.__connection = None
-        self.__channel = None
+        self.__pool_size = pool_size
+        self.__connection: Optional[AbstractRobustConnection] = None
+        self.__channel_pool: Optional[Pool[AbstractRobustChannel]] = None
 
-    async def __connect(self):
-        try:
-            url = f"amqp://{self.__username}:{self.__password}@{self.__host}:{self.__port}/"
-            print(f"Connecting to RabbitMQ: {url}")
+    @property
+    def is_connected(self) -> bool:
+        return self.__connection is not None and not self.__connection.is_closed
 
-            self.__connection = await aio_pika.connect_robust(url)
-            self.__channel = await self.__connection.channel()
+    async def connect(self):
+        if self.is_connected:
+            return
 
-            exchange = await self.__channel.declare_exchange(
-                self.__exchange,
-                aio_pika.ExchangeType.DIRECT,
-                durable=True
-            )
+        logger.info("Conectando ao RabbitMQ em %s:%s.", settings.RABBITMQ_HOST, settings.RABBITMQ_PORT)
+        self.__connection = await aio_pika.connect_robust(self.__url)
+        self.__connection.reconnect_callbacks.add(self.__on_reconnect)
+        self.__channel_pool = Pool(self.__open_channel, max_size=self.__pool_size)
 
-            queue = await self.__channel.declare_queue(
-                self.__queue,
-                durable=True
-            )
+        await self.__declare_topology()
 
-            await queue.bind(exchange, routing_key=self.__routing_key)
+    async def close(self):
+        if self.__channel_pool and not self.__channel_pool.is_closed:
+            await self.__channel_pool.close()
+        if self.__connection and not self.__connection.is_closed:
+            await self.__connection.close()
 
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erro na conexão com o RabbitMQ."
-            )
+        self.__channel_pool = None
+        self.__connection = None
 
-    async def send_message(self, body: Dict):
-        await self.__connect()
+    async def __open_channel(self) -> AbstractRobustChannel:
+        return await self.__connection.channel(publisher_confirms=True, on_return_raises=True)
 
+    async def __declare_topology(self):
+        async with self.__channel_pool.acquire() as channel:
+            await declare_topology(channel)
+
+    async def __on_reconnect(self, *_):
+        logger.warning("Conexão com o RabbitMQ restabelecida. Redeclarando a topologia.")
+        await self.__declare_topology()
+
+    @staticmethod
+    def build_message(
+            body: Dict,
+            correlation_id: Optional[str] = None,
+            timestamp: Optional[datetime] = None
+    ) -> aio_pika.Message:
+        return aio_pika.Message(
+            body=json.dumps(body).encode(),
+            content_type="application/json",
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            timestamp=timestamp or datetime.now(timezone.utc),
+            correlation_id=correlation_id
+        )
+
+    async def publish_batch(self, messages: List[Tuple[str, aio_pika.Message]]) -> List[Optional[Exception]]:
+        if not self.is_connected or not self.__channel_pool:
+            return [ConnectionError("Sem conexão com o RabbitMQ.")] * len(messages)
+
+        RABBITMQ_PUBLISH_BATCH_SIZE.observe(len(messages))
+        started_at = perf_counter()
         try:
-            exchange = await self.__channel.get_exchange(self.__exchange)
-
-            message_body = aio_pika.Message(
-                body=json.dumps(body).encode(),
-                content_type="application/json",
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
-            )
-
-            await exchange.publish(
-                message_body,
-                routing_key=self.__routing_key
-            )
+            async with self.__channel_pool.acquire() as channel:
+                if channel.is_closed:
+                    await channel.reopen()
+
+                exchange = await channel.get_exchange(self.__exchange, ensure=False)
+                results = await asyncio.gather(
+                    *(exchange.publish(message, routing_key=routing_key) for routing_key, message in messages),
+                    return_exceptions=True
+                )
         except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Erro no envio da mensagem. {e}"
-            )
-        finally:
-            if self.__connection:
-                await self.__connection.close()
+            results = [e] * len(messages)
+
+        elapsed = perf_counter() - started_at
+        for routing_key in dict.fromkeys(routing_key for routing_key, _ in messages):
+            RABBITMQ_PUBLISH_DURATION_SECONDS.labels(routing_key=routing_key).observe(elapsed)
+
+        errors = []
+        for (routing_key, _), result in zip(messages, results):
+            error = result if isinstance(result, BaseException) else None
+            if error:
+                RABBITMQ_PUBLISH_ERRORS_TOTAL.labels(routing_key=routing_key).inc()
+            errors.append(error)
+
+        return errors
+
+
+rabbitmq_publisher = RabbitmqPublisher(
+    exchange=POST_EXCHANGE,
+    pool_size=settings.RABBITMQ_CHANNEL_POOL_SIZE
+)
 
-    @staticmethod
-    def publisher(exchange: str, routing_key: str, queue: str):
-        if not exchange or not routing_key or not queue:
-            print(exchange, routing_key, queue)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Erro ao receber as variáveis do RabbitMQ."
-            )
-
-        return RabbitmqPublisher(exchange, routing_key, queue)
@@ -0,0 +1,73 @@
+import aio_pika
+from aio_pika.abc import AbstractChannel
+
+from app.core.configs import settings
+
+POST_EXCHANGE = "post_exchange"
+RETRY_EXCHANGE = "post_retry_exchange"
+DEAD_LETTER_EXCHANGE = "post_dead_letter_exchange"
+
+CREATED_QUEUE = "created_queue"
+ON_COURSE_QUEUE = "on_course_queue"
+DELIVERED_QUEUE = "delivered_queue"
+
+CREATED_ROUTING_KEY = "created_rk"
+ON_COURSE_ROUTING_KEY = "on_course_rk"
+DELIVERED_ROUTING_KEY = "delivered_rk"
+
+QUEUE_BINDINGS = {
+    CREATED_QUEUE: CREATED_ROUTING_KEY,
+    ON_COURSE_QUEUE: ON_COURSE_ROUTING_KEY,
+    DELIVERED_QUEUE: DELIVERED_ROUTING_KEY
+}
+
+RETRY_COUNT_HEADER = "x-retry-count"
+
+
+def retry_delay(attempt: int) -> int:
+    return int(settings.NOTIFICATION_RETRY_BASE_DELAY * 1000 * 2 ** attempt)
+
+
+def retry_queue_name(queue_name: str, attempt: int) -> str:
+    return f"{queue_name}.retry.{retry_delay(attempt)}"
+
+
+def dead_letter_queue_name(queue_name: str) -> str:
+    return f"{queue_name}.dead_letter"
+
+
+async def declare_topology(channel: AbstractChannel):
+    exchange = await channel.declare_exchange(
+        POST_EXCHANGE,
+        aio_pika.ExchangeType.DIRECT,
+        durable=True
+    )
+    retry_exchange = await channel.declare_exchange(
+        RETRY_EXCHANGE,
+        aio_pika.ExchangeType.DIRECT,
+        durable=True
+    )
+    dead_letter_exchange = await channel.declare_exchange(
+        DEAD_LETTER_EXCHANGE,
+        aio_pika.ExchangeType.DIRECT,
+        durable=True
+    )
+
+    for queue_name, routing_key in QUEUE_BINDINGS.items():
+        queue = await channel.declare_queue(queue_name, durable=True)
+        await queue.bind(exchange, routing_key=routing_key)
+
+        for attempt in range(settings.NOTIFICATION_MAX_RETRIES):
+            retry_queue = await channel.declare_queue(
+                retry_queue_name(queue_name, attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": retry_delay(attempt),
+                    "x-dead-letter-exchange": POST_EXCHANGE,
+                    "x-dead-letter-routing-key": routing_key
+                }
+            )
+            await retry_queue.bind(retry_exchange, routing_key=retry_queue_name(queue_name, attempt))
+
+        dead_letter_queue = await channel.declare_queue(dead_letter_queue_name(queue_name), durable=True)
+        await dead_letter_queue.bind(dead_letter_exchange, routing_key=queue_name)
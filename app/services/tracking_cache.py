@@ -0,0 +1,253 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+from app.core.cache import TTLCache
+from app.core.configs import settings
+from app.core.metrics import POST_CACHE_REQUESTS_TOTAL
+
+logger = logging.getLogger(__name__)
+
+PostLoader = Callable[[], Awaitable[Optional[str]]]
+
+POST_KEY_PREFIX = "post:v2"
+INVALIDATION_CHANNEL = "post:invalidate"
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+_PROCESS_ID = uuid4().hex
+
+_local_cache = TTLCache(maxsize=settings.POST_CACHE_L1_MAXSIZE, ttl=settings.POST_CACHE_L1_TTL)
+_in_flight: Dict[str, asyncio.Task] = {}
+_release_lock_script: Optional[AsyncScript] = None
+
+
+def _get_release_lock_script(redis_client: redis.Redis) -> AsyncScript:
+    global _release_lock_script
+
+    if _release_lock_script is None:
+        _release_lock_script = redis_client.register_script(_RELEASE_LOCK_SCRIPT)
+
+    return _release_lock_script
+
+
+class TrackingCache:
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    @staticmethod
+    def _redis_key(tracking_code: str) -> str:
+        return f"{POST_KEY_PREFIX}:{tracking_code}"
+
+    @classmethod
+    def _lock_key(cls, tracking_code: str) -> str:
+        return f"{cls._redis_key(tracking_code)}:lock"
+
+    @staticmethod
+    def _store_local(tracking_code: str, post_json: str):
+        if settings.POST_CACHE_L1_ENABLED:
+            _local_cache.set(tracking_code, post_json)
+
+    async def get(self, tracking_code: str) -> Optional[str]:
+        try:
+            return await self.redis.get(self._redis_key(tracking_code))
+        except redis.RedisError as e:
+            logger.warning("Falha ao consultar o cache de postagens no Redis. Erro: %s", e)
+            return None
+
+    async def get_many(self, tracking_codes: List[str]) -> Dict[str, str]:
+        found = {}
+        remaining = tracking_codes
+
+        if settings.POST_CACHE_L1_ENABLED:
+            for tracking_code in tracking_codes:
+                post_json = _local_cache.get(tracking_code)
+                if post_json:
+                    found[tracking_code] = post_json
+
+            remaining = [tracking_code for tracking_code in tracking_codes if tracking_code not in found]
+            POST_CACHE_REQUESTS_TOTAL.labels(tier="local", result="hit").inc(len(found))
+            POST_CACHE_REQUESTS_TOTAL.labels(tier="local", result="miss").inc(len(remaining))
+
+        if not remaining:
+            return found
+
+        try:
+            posts_json = await self.redis.mget([self._redis_key(tracking_code) for tracking_code in remaining])
+        except redis.RedisError as e:
+            logger.warning("Falha ao consultar o cache de postagens no Redis. Erro: %s", e)
+            posts_json = [None] * len(remaining)
+
+        hits = 0
+        for tracking_code, post_json in zip(remaining, posts_json):
+            if post_json:
+                hits += 1
+                found[tracking_code] = post_json
+                self._store_local(tracking_code, post_json)
+
+        POST_CACHE_REQUESTS_TOTAL.labels(tier="redis", result="hit").inc(hits)
+        POST_CACHE_REQUESTS_TOTAL.labels(tier="redis", result="miss").inc(len(remaining) - hits)
+
+        return found
+
+    async def set(self, tracking_code: str, post_json: str, invalidate: bool = False, nx: bool = False) -> str:
+        key = self._redis_key(tracking_code)
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, post_json, ex=settings.POST_CACHE_TTL, nx=nx)
+                if nx:
+                    pipe.get(key)
+                if invalidate:
+                    pipe.publish(INVALIDATION_CHANNEL, f"{_PROCESS_ID}:{tracking_code}")
+                results = await pipe.execute()
+
+            if nx and results[1]:
+                post_json = results[1]
+        except redis.RedisError as e:
+            logger.warning("Falha ao gravar o cache de postagens no Redis. Erro: %s", e)
+
+        self._store_local(tracking_code, post_json)
+        return post_json
+
+    async def set_many(self, posts_json: Iterable[Tuple[str, str]], invalidate: bool = False):
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for tracking_code, post_json in posts_json:
+                    self._store_local(tracking_code, post_json)
+                    pipe.set(self._redis_key(tracking_code), post_json, ex=settings.POST_CACHE_TTL)
+                    if invalidate:
+                        pipe.publish(INVALIDATION_CHANNEL, f"{_PROCESS_ID}:{tracking_code}")
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning("Falha ao gravar o cache de postagens no Redis. Erro: %s", e)
+
+    async def get_or_load(self, tracking_code: str, loader: PostLoader) -> Optional[str]:
+        if settings.POST_CACHE_L1_ENABLED:
+            post_json = _local_cache.get(tracking_code)
+            POST_CACHE_REQUESTS_TOTAL.labels(tier="local", result="hit" if post_json else "miss").inc()
+            if post_json:
+                return post_json
+
+        post_json = await self.get(tracking_code)
+        POST_CACHE_REQUESTS_TOTAL.labels(tier="redis", result="hit" if post_json else "miss").inc()
+        if post_json:
+            self._store_local(tracking_code, post_json)
+            return post_json
+
+        key = self._redis_key(tracking_code)
+        task = _in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(tracking_code, loader))
+            _in_flight[key] = task
+            task.add_done_callback(lambda _: _in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _load(self, tracking_code: str, loader: PostLoader) -> Optional[str]:
+        lock_key = self._lock_key(tracking_code)
+        token = uuid4().hex
+
+        try:
+            locked = await self.redis.set(lock_key, token, nx=True, px=int(settings.POST_CACHE_LOCK_TTL * 1000))
+        except redis.RedisError as e:
+            logger.warning("Falha ao obter o lock do cache de postagens no Redis. Erro: %s", e)
+            return await loader()
+
+        if not locked:
+            post_json = await self._wait_for_fill(tracking_code)
+            if post_json:
+                self._store_local(tracking_code, post_json)
+                return post_json
+
+            return await self._fill(tracking_code, loader)
+
+        try:
+            return await self._fill(tracking_code, loader)
+        finally:
+            try:
+                await _get_release_lock_script(self.redis)(keys=[lock_key], args=[token], client=self.redis)
+            except redis.RedisError as e:
+                logger.warning("Falha ao liberar o lock do cache de postagens no Redis. Erro: %s", e)
+
+    async def _fill(self, tracking_code: str, loader: PostLoader) -> Optional[str]:
+        post_json = await loader()
+        if post_json:
+            # A leitura pode ser anterior a uma atualização que já gravou o cache; nesse caso, prevalece o valor gravado.
+            post_json = await self.set(tracking_code, post_json, nx=True)
+
+        return post_json
+
+    async def _wait_for_fill(self, tracking_code: str) -> Optional[str]:
+        deadline = monotonic() + settings.POST_CACHE_LOCK_WAIT
+        while monotonic() < deadline:
+            await asyncio.sleep(settings.POST_CACHE_LOCK_POLL_INTERVAL)
+            post_json = await self.get(tracking_code)
+            if post_json:
+                return post_json
+
+        return None
+
+
+class TrackingCacheSubscriber:
+    def __init__(self, poll_timeout: float, reconnect_delay: float):
+        self.__poll_timeout = poll_timeout
+        self.__reconnect_delay = reconnect_delay
+        self.__task: Optional[asyncio.Task] = None
+
+    def start(self, redis_client: redis.Redis):
+        if settings.POST_CACHE_L1_ENABLED and self.__task is None:
+            self.__task = asyncio.create_task(self.__listen(redis_client))
+
+    async def stop(self):
+        if self.__task is None:
+            return
+
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    async def __listen(self, redis_client: redis.Redis):
+        while True:
+            try:
+                async with redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    _local_cache.clear()
+
+                    while True:
+                        message = await pubsub.get_message(timeout=self.__poll_timeout)
+                        if message:
+                            self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Falha na inscrição de invalidação do cache de postagens. Nova tentativa em %ss. Erro: %s",
+                    self.__reconnect_delay,
+                    e
+                )
+                _local_cache.clear()
+                await asyncio.sleep(self.__reconnect_delay)
+
+    @staticmethod
+    def handle_message(data: str):
+        origin, _, tracking_code = data.partition(":")
+        if origin != _PROCESS_ID:
+            _local_cache.pop(tracking_code)
+
+
+tracking_cache_subscriber = TrackingCacheSubscriber(poll_timeout=1, reconnect_delay=1)
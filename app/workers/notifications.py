@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import signal
+
+import aio_pika
+from prometheus_client import start_http_server
+
+from app.core.configs import settings
+from app.core.logger import setup_logging
+from app.services.email_dispatcher import email_dispatcher
+from app.services.notification_services import NotificationServices
+from app.services.rabbitmq_consumer import RabbitmqConsumer
+from app.services.rabbitmq_topology import CREATED_QUEUE, ON_COURSE_QUEUE, DELIVERED_QUEUE
+
+logger = logging.getLogger(__name__)
+
+
+async def run():
+    notification_services = NotificationServices(email_dispatcher)
+    consumers = [
+        RabbitmqConsumer(CREATED_QUEUE, notification_services.handle_post_created, settings.NOTIFICATION_WORKER_CONCURRENCY),
+        RabbitmqConsumer(ON_COURSE_QUEUE, notification_services.handle_post_on_course, settings.NOTIFICATION_WORKER_CONCURRENCY),
+        RabbitmqConsumer(DELIVERED_QUEUE, notification_services.handle_post_delivered, settings.NOTIFICATION_WORKER_CONCURRENCY)
+    ]
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    start_http_server(settings.NOTIFICATION_METRICS_PORT)
+    connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
+    try:
+        for consumer in consumers:
+            await consumer.start(connection)
+
+        while not stop_event.is_set():
+            for consumer in consumers:
+                try:
+                    await consumer.refresh_queue_depth()
+                except Exception as e:
+                    logger.warning("Não foi possível consultar a profundidade da fila. Erro: %s", e)
+            try:
+                await asyncio.wait_for(stop_event.wait(), settings.NOTIFICATION_METRICS_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info("Encerrando o worker de notificações.")
+    finally:
+        for consumer in consumers:
+            await consumer.stop()
+        await connection.close()
+        await email_dispatcher.close()
+
+
+if __name__ == "__main__":
+    log_listener = setup_logging()
+    try:
+        asyncio.run(run())
+    finally:
+        log_listener.stop()
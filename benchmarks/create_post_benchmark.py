@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import statistics
+from datetime import datetime, timedelta
+from time import perf_counter
+from uuid import uuid4
+
+import redis.asyncio as redis
+from pytz import timezone
+from sqlalchemy import event, select
+
+from app.core.database import engine, async_session
+from app.models.address_model import AddressModel
+from app.models.client_auth_model import ClientAuthModel
+from app.models.outbox_model import OutboxMessageModel
+from app.models.post_event_model import PostEventModel
+from app.models.posting_model import PostModel, PostStatus
+from app.services.posting_services import PostingServices
+from app.services.rabbitmq_topology import CREATED_ROUTING_KEY
+
+
+class RoundTripCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *_, **__):
+        self.count += 1
+
+
+def build_models():
+    current_time = datetime.now(tz=timezone("America/Sao_Paulo"))
+
+    address = AddressModel(
+        cep="01001000",
+        cidade="SAO PAULO",
+        estado="SP",
+        rua="PRACA DA SE",
+        bairro="SE",
+        numero="1",
+        complemento="BENCHMARK"
+    )
+    post = PostModel(
+        email="BENCHMARK@EMAIL.COM",
+        peso=6.8,
+        altura=10,
+        largura=5,
+        comprimento=10,
+        volume=500,
+        valor_frete=23.6,
+        transportadora="CORREIOS",
+        eventos=[PostEventModel(status_postagem=PostStatus.CRIADO, ocorrido_em=current_time)],
+        data_criacao=current_time,
+        status_postagem=PostStatus.CRIADO,
+        previsao_entrega=current_time + timedelta(days=20),
+        codigo_rastreamento=uuid4()
+    )
+
+    return address, post
+
+
+async def legacy_create(db, address: AddressModel, post: PostModel):
+    db.add(address)
+    await db.commit()
+    await db.refresh(address)
+
+    while True:
+        query = await db.execute(
+            select(PostModel).where(PostModel.codigo_rastreamento == post.codigo_rastreamento)
+        )
+        if not query.scalars().first():
+            break
+        post.codigo_rastreamento = uuid4()
+
+    post.endereco_id = address.id
+    db.add(post)
+    await db.flush()
+    db.add(OutboxMessageModel(
+        **PostingServices.outbox_message(CREATED_ROUTING_KEY, PostingServices.post_created_message(post))
+    ))
+    await db.commit()
+    await db.refresh(post)
+
+
+async def single_round_trip_create(db, address: AddressModel, post: PostModel):
+    await PostingServices(db=db, redis_client=redis.Redis()).insert_post(address, post)
+
+
+async def measure(create, iterations: int, counter: RoundTripCounter):
+    latencies = []
+    counter.count = 0
+
+    for _ in range(iterations):
+        address, post = build_models()
+        async with async_session() as db:
+            start = perf_counter()
+            await create(db, address, post)
+            latencies.append(perf_counter() - start)
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return counter.count / iterations, percentiles[49] * 1000, percentiles[98] * 1000
+
+
+async def main(iterations: int, warmup: int):
+    counter = RoundTripCounter()
+
+    for name in ("begin", "before_cursor_execute", "commit", "rollback"):
+        event.listen(engine.sync_engine, name, counter)
+
+    flows = (
+        ("antes (commit por tabela)", legacy_create),
+        ("depois (INSERT ... CTE)", single_round_trip_create)
+    )
+
+    for _, create in flows:
+        await measure(create, warmup, counter)
+
+    print(f"{'fluxo':<26}{'round trips':>12}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for name, create in flows:
+        round_trips, p50, p99 = await measure(create, iterations, counter)
+        print(f"{name:<26}{round_trips:>12.1f}{p50:>12.2f}{p99:>12.2f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compara round trips e latência da criação de postagens. Use um banco descartável."
+    )
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.warmup))
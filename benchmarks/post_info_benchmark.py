@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import statistics
+from time import process_time
+
+import httpx
+from fastapi import FastAPI, Response, status
+
+from app.schemas.posting_schema import PostResponse, PostResponseWrapper
+from app.services.posting_services import POST_INFO_RESPONSE_PREFIX, POST_INFO_RESPONSE_SUFFIX
+
+CACHED_POST = PostResponse.model_validate({
+    "id": 1,
+    "endereco_id": 1,
+    "email": "JOAODASILVA@EMAIL.COM",
+    "peso": 6.8,
+    "altura": 10.0,
+    "largura": 5.0,
+    "comprimento": 10.0,
+    "volume": 500.0,
+    "valor_frete": 23.6,
+    "data_criacao": "22/12/2024 15:39:18",
+    "status_postagem": "EM_TRANSITO",
+    "data_envio": "23/12/2024 09:12:45",
+    "previsao_entrega": "11/01/2025",
+    "data_entrega": None,
+    "transportadora": "CORREIOS",
+    "codigo_rastreamento": "d343530a-5a8a-4a07-ad51-c6458de8ffd8",
+    "historico_atualizacoes": {
+        "2024-12-22T15:39:18.512304-03:00": "CRIADO",
+        "2024-12-23T09:12:45.660213-03:00": "EM_TRANSITO"
+    },
+    "endereco": {
+        "id": 1,
+        "cep": "12345678",
+        "cidade": "RIO VERDE",
+        "estado": "GO",
+        "rua": "RUA FELICIDADE",
+        "bairro": "BAIRRO ALEGRIA",
+        "numero": "123",
+        "complemento": "APTO. 10"
+    }
+}).model_dump_json()
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/antes", response_model=PostResponseWrapper)
+    async def legacy_get_post_info() -> PostResponseWrapper:
+        return PostResponseWrapper(
+            status_code=status.HTTP_200_OK,
+            message="Postagem retornada com sucesso.",
+            data=PostResponse.model_validate_json(CACHED_POST)
+        )
+
+    @app.get("/depois", response_model=PostResponseWrapper)
+    async def raw_get_post_info() -> Response:
+        return Response(
+            content=POST_INFO_RESPONSE_PREFIX + CACHED_POST.encode() + POST_INFO_RESPONSE_SUFFIX,
+            media_type="application/json"
+        )
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, iterations: int) -> list:
+    samples = []
+    for _ in range(iterations):
+        started_at = process_time()
+        response = await client.get(path)
+        samples.append((process_time() - started_at) * 1_000_000)
+        response.raise_for_status()
+
+    return samples
+
+
+async def main(iterations: int, warmup: int):
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        legacy_body = (await client.get("/antes")).content
+        raw_body = (await client.get("/depois")).content
+        assert legacy_body == raw_body, "As respostas dos dois fluxos divergem."
+
+        flows = (
+            ("antes (valida e serializa)", "/antes"),
+            ("depois (bytes do cache)", "/depois")
+        )
+
+        for _, path in flows:
+            await measure(client, path, warmup)
+
+        print(f"{'fluxo':<28}{'CPU p50 (µs)':>14}{'CPU média (µs)':>16}")
+        for name, path in flows:
+            samples = await measure(client, path, iterations)
+            print(f"{name:<28}{statistics.median(samples):>14.1f}{statistics.fmean(samples):>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compara o custo de CPU por requisição de um cache hit em posting/info antes e depois do envio direto dos bytes do cache."
+    )
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.warmup))
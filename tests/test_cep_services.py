@@ -0,0 +1,89 @@
+import asyncio
+import json
+import time
+
+import brazilcep
+import pytest
+from brazilcep.exceptions import CEPNotFound
+from fakeredis import FakeAsyncRedis
+
+from app.core.configs import settings
+from app.services import cep_services as cep_services_module
+from app.services.cep_services import CepServices
+
+ADDRESS = {"cep": "01001000", "city": "São Paulo", "uf": "SP", "street": "Praça da Sé", "district": "Sé"}
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    cep_services_module._local_cache.clear()
+    yield
+    cep_services_module._local_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_cep_services_caches_not_found_ceps_for_a_shorter_time(monkeypatch):
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    calls = 0
+
+    def get_address_from_cep(cep):
+        nonlocal calls
+        calls += 1
+        raise CEPNotFound(cep)
+
+    monkeypatch.setattr(brazilcep, "get_address_from_cep", get_address_from_cep)
+    cep_services = CepServices(redis_client)
+
+    assert await cep_services.get_address("99999999") is None
+    assert await redis_client.get("cep:99999999") == "null"
+    assert 0 < await redis_client.ttl("cep:99999999") <= settings.CEP_NEGATIVE_CACHE_TTL
+
+    assert await cep_services.get_address("99999999") is None
+    cep_services_module._local_cache.clear()
+    assert await cep_services.get_address("99999999") is None
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cep_services_looks_up_concurrent_misses_once(monkeypatch):
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    calls = 0
+
+    def get_address_from_cep(cep):
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return ADDRESS
+
+    monkeypatch.setattr(brazilcep, "get_address_from_cep", get_address_from_cep)
+    cep_services = CepServices(redis_client)
+
+    results = await asyncio.gather(*(cep_services.get_address("01001000") for _ in range(20)))
+
+    assert results == [ADDRESS] * 20
+    assert calls == 1
+    assert json.loads(await redis_client.get("cep:01001000")) == ADDRESS
+    assert settings.CEP_NEGATIVE_CACHE_TTL < await redis_client.ttl("cep:01001000") <= settings.CEP_CACHE_TTL
+    await asyncio.sleep(0)
+    assert not cep_services_module._in_flight
+
+
+@pytest.mark.asyncio
+async def test_cep_services_times_out_slow_provider_without_caching(monkeypatch):
+    redis_client = FakeAsyncRedis(decode_responses=True)
+
+    def get_address_from_cep(cep):
+        time.sleep(0.3)
+        return ADDRESS
+
+    monkeypatch.setattr(brazilcep, "get_address_from_cep", get_address_from_cep)
+    monkeypatch.setattr(settings, "CEP_LOOKUP_TIMEOUT", 0.05)
+    cep_services = CepServices(redis_client)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await cep_services.get_address("01001000")
+
+    assert not await redis_client.exists("cep:01001000")
+    assert cep_services_module._local_cache.get("01001000", "ausente") == "ausente"
+    await asyncio.sleep(0)
+    assert not cep_services_module._in_flight
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+from fastapi import HTTPException
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+
+from app.core.configs import settings
+from app.models.address_model import AddressModel
+from app.models.client_auth_model import ClientAuthModel
+from app.models.outbox_model import OutboxMessageModel
+from app.models.posting_model import PostModel
+from app.services.posting_services import PostingServices
+
+ADDRESS = {"city": "São Paulo", "uf": "SP", "street": "Praça da Sé", "district": "Sé"}
+
+
+def post_data(cep: str = "01001000", **fields) -> dict:
+    return {
+        "peso": 1.5,
+        "altura": 10,
+        "largura": 10,
+        "comprimento": 10,
+        "transportadora": "CORREIOS",
+        "email": "destinatario@email.com",
+        "endereco": {"cep": cep, "numero": "1", "complemento": None},
+        **fields
+    }
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    url_postgres = settings.DB_URL
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    db_engine = create_async_engine(url_postgres)
+    try:
+        yield db_engine
+    finally:
+        await db_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def fixtures(db_engine, monkeypatch):
+    now = datetime.now(timezone.utc)
+    async with db_engine.begin() as connection:
+        client_id = await connection.scalar(
+            insert(ClientAuthModel).values(
+                data_cadastro=now,
+                nome="Cliente",
+                cpf_cnpj=uuid4().hex[:14],
+                client_secret="segredo",
+                hash_token="token",
+                token_expiracao=now + timedelta(days=1)
+            ).returning(ClientAuthModel.client_id)
+        )
+
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        posting_services = PostingServices(db=session, redis_client=aioredis.FakeRedis(decode_responses=True))
+
+        async def get_address(cep):
+            return ADDRESS if cep == "01001000" else None
+
+        monkeypatch.setattr(posting_services.cep_services, "get_address", get_address)
+        yield posting_services, client_id
+
+    async with db_engine.begin() as connection:
+        address_ids = (await connection.execute(
+            delete(PostModel).where(PostModel.client_id == client_id).returning(PostModel.endereco_id)
+        )).scalars().all()
+        await connection.execute(delete(AddressModel).where(AddressModel.id.in_(address_ids)))
+        await connection.execute(delete(ClientAuthModel).where(ClientAuthModel.client_id == client_id))
+        await connection.execute(delete(OutboxMessageModel))
+
+
+@pytest.mark.asyncio
+async def test_create_posts_batch_reports_each_invalid_item(db_engine, fixtures):
+    posting_services, client_id = fixtures
+
+    response = await posting_services.create_new_posts(
+        [
+            post_data(),
+            post_data(peso=-1),
+            {key: value for key, value in post_data().items() if key != "email"},
+            post_data(cep="99999999"),
+            post_data(endereco={"cep": "0100100A", "numero": "1", "complemento": None})
+        ],
+        client_id
+    )
+
+    assert response["status_code"] == 207
+    assert [(result.indice, result.status_code) for result in response["data"]] == [
+        (0, 201), (1, 400), (2, 422), (3, 400), (4, 400)
+    ]
+    assert response["data"][1].message == "O peso deve ser maior que 0."
+    assert response["data"][3].message == "CEP inválido ou não encontrado."
+    assert response["data"][4].message == "O CEP deve conter apenas números."
+
+    async with db_engine.connect() as connection:
+        created = (await connection.execute(
+            select(PostModel.codigo_rastreamento).where(PostModel.client_id == client_id)
+        )).scalars().all()
+    assert created == [response["data"][0].data.codigo_rastreamento]
+
+
+@pytest.mark.asyncio
+async def test_create_posts_batch_rejects_empty_and_oversized_requests(monkeypatch):
+    posting_services = PostingServices(db=None, redis_client=aioredis.FakeRedis(decode_responses=True))
+    monkeypatch.setattr(settings, "POSTING_BATCH_MAX_SIZE", 2)
+
+    with pytest.raises(HTTPException) as empty:
+        await posting_services.create_new_posts([], client_id=1)
+    with pytest.raises(HTTPException) as oversized:
+        await posting_services.create_new_posts([post_data()] * 3, client_id=1)
+
+    assert (empty.value.status_code, empty.value.detail) == (400, "Informe ao menos uma postagem.")
+    assert (oversized.value.status_code, oversized.value.detail) == (
+        400, "Limite de 2 postagens por requisição excedido."
+    )
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core import deps as deps_module
+from app.core.auth import create_access_token
+from app.core.configs import settings
+from app.core.deps import CurrentClient, get_current_user
+from app.models.client_auth_model import ClientAuthModel
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    url_postgres = settings.DB_URL
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    db_engine = create_async_engine(url_postgres)
+    try:
+        yield db_engine
+    finally:
+        await db_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def fixtures(db_engine, monkeypatch):
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_REDIS_ENABLED", True)
+    deps_module._principal_cache.clear()
+    now = datetime.now(timezone.utc)
+    cpf_cnpj = uuid4().hex[:14]
+
+    async with db_engine.begin() as connection:
+        client_id = await connection.scalar(
+            insert(ClientAuthModel).values(
+                data_cadastro=now,
+                nome="Cliente",
+                cpf_cnpj=cpf_cnpj,
+                client_secret="segredo",
+                hash_token="token",
+                token_expiracao=now + timedelta(days=1)
+            ).returning(ClientAuthModel.client_id)
+        )
+
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        queries = 0
+        execute = session.execute
+
+        async def count_execute(statement, *args, **kwargs):
+            nonlocal queries
+            queries += 1
+            return await execute(statement, *args, **kwargs)
+
+        monkeypatch.setattr(session, "execute", count_execute)
+
+        async def authenticate(redis_client) -> CurrentClient:
+            return await get_current_user(
+                db=session,
+                redis_client=redis_client,
+                token=HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(cpf_cnpj))
+            )
+
+        yield authenticate, client_id, lambda: queries
+
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(ClientAuthModel).where(ClientAuthModel.client_id == client_id))
+    deps_module._principal_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_serves_cached_client_without_database(db_engine, fixtures):
+    authenticate, client_id, queries = fixtures
+    redis_client = aioredis.FakeRedis(decode_responses=True)
+
+    usuario = await authenticate(redis_client)
+    assert usuario.client_id == client_id
+    assert queries() == 1
+
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(ClientAuthModel).where(ClientAuthModel.client_id == client_id))
+
+    assert await authenticate(redis_client) == usuario
+    deps_module._principal_cache.clear()
+    assert await authenticate(redis_client) == usuario
+    assert queries() == 1
+
+    deps_module._principal_cache.clear()
+    with pytest.raises(HTTPException) as error:
+        await authenticate(aioredis.FakeRedis(decode_responses=True))
+
+    assert error.value.status_code == 401
+    assert queries() == 2
@@ -0,0 +1,90 @@
+import asyncio
+import socket
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.services.email_dispatcher import EmailDispatcher
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+        self.peers = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        self.peers.add(session.peer)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def _message(index: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "postagens@email.com"
+    message["To"] = f"destinatario{index}@email.com"
+    message["Subject"] = "Teste"
+    message.set_content("Conteúdo")
+    return message
+
+
+@pytest.mark.asyncio
+async def test_email_dispatcher_reuses_pooled_sessions(smtp_server):
+    handler, port = smtp_server
+    dispatcher = EmailDispatcher(
+        hostname="127.0.0.1",
+        port=port,
+        username=None,
+        password=None,
+        use_tls=False,
+        start_tls=False,
+        pool_size=2,
+        max_messages_per_session=100,
+        timeout=5
+    )
+
+    try:
+        await asyncio.gather(*(dispatcher.send(_message(index)) for index in range(10)))
+    finally:
+        await dispatcher.close()
+
+    assert len(handler.messages) == 10
+    assert len(handler.peers) <= 2
+
+
+@pytest.mark.asyncio
+async def test_email_dispatcher_recycles_sessions_after_limit(smtp_server):
+    handler, port = smtp_server
+    dispatcher = EmailDispatcher(
+        hostname="127.0.0.1",
+        port=port,
+        username=None,
+        password=None,
+        use_tls=False,
+        start_tls=False,
+        pool_size=1,
+        max_messages_per_session=2,
+        timeout=5
+    )
+
+    try:
+        for index in range(4):
+            await dispatcher.send(_message(index))
+    finally:
+        await dispatcher.close()
+
+    assert len(handler.messages) == 4
+    assert len(handler.peers) == 2
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.core.configs import settings
+from app.services.freight_engine import FreightEngine
+
+
+def legacy_freight(peso, volume):
+    valor_frete = 20
+    if peso > 5:
+        valor_frete += (peso - 5) * 2
+    if volume > 3000:
+        valor_frete += ((volume - 3000) // 500)
+    return valor_frete
+
+
+def test_freight_engine_default_table_matches_legacy_formula():
+    engine = FreightEngine(settings.FREIGHT_RATES_PATH)
+    rng = np.random.default_rng(42)
+    pesos = np.round(rng.uniform(0.01, 50, 5000), 2)
+    volumes = np.round(rng.uniform(1, 20000, 5000), 2)
+
+    quotes = engine.quote(pesos, volumes, ["CORREIOS"] * 5000)
+
+    assert quotes.tolist() == [legacy_freight(peso, volume) for peso, volume in zip(pesos.tolist(), volumes.tolist())]
+
+
+def test_freight_engine_uses_carrier_table_and_falls_back_to_default(tmp_path):
+    rates = {
+        "padrao": {
+            "valor_base": 20,
+            "peso_franquia": 5,
+            "valor_kg_excedente": 2,
+            "volume_franquia": 3000,
+            "volume_bloco": 500,
+            "valor_bloco_excedente": 1
+        },
+        "transportadoras": {
+            "jadlog": {
+                "valor_base": 15,
+                "peso_franquia": 10,
+                "valor_kg_excedente": 1.5,
+                "volume_franquia": 5000,
+                "volume_bloco": 1000,
+                "valor_bloco_excedente": 2
+            }
+        }
+    }
+    rates_path = tmp_path / "freight_rates.json"
+    rates_path.write_text(json.dumps(rates))
+    engine = FreightEngine(str(rates_path))
+
+    quotes = engine.quote(np.array([12.0, 12.0]), np.array([7500.0, 7500.0]), ["Jadlog", "LOGGI"])
+
+    assert quotes.tolist() == [15 + 2 * 1.5 + 2 * 2, 20 + 7 * 2 + 9 * 1]
+
+
+@pytest.mark.parametrize("field, value", [("volume_bloco", 0), ("volume_bloco", -500), ("valor_kg_excedente", -2)])
+def test_freight_engine_rejects_invalid_rates(tmp_path, field, value):
+    rates = json.loads(Path(settings.FREIGHT_RATES_PATH).read_text(encoding="utf-8"))
+    rates["transportadoras"] = {"jadlog": {**rates["padrao"], field: value}}
+    rates_path = tmp_path / "freight_rates.json"
+    rates_path.write_text(json.dumps(rates))
+
+    with pytest.raises(ValueError, match=f"JADLOG inválida: {field}"):
+        FreightEngine(str(rates_path)).load()
@@ -0,0 +1,48 @@
+import json
+import os
+
+from app.services.lead_time_table import LeadTimeTable
+
+
+def write_lead_times(path, prazo_rj):
+    path.write_text(json.dumps({
+        "padrao": 20,
+        "transportadoras": {
+            "correios": {
+                "padrao": 12,
+                "prazos": {"SP": {"SP": 2, "RJ": prazo_rj}}
+            }
+        }
+    }))
+
+
+def test_lead_time_table_falls_back_to_carrier_and_default_lead_times(tmp_path):
+    lead_times_path = tmp_path / "lead_times.json"
+    write_lead_times(lead_times_path, 3)
+    table = LeadTimeTable(str(lead_times_path), reload_interval=30)
+
+    lead_times = table.estimate(["CORREIOS", "Correios", "CORREIOS", "JADLOG"], ["SP", "rj", None, "SP"], origem="SP")
+
+    assert lead_times.tolist() == [2, 3, 12, 20]
+    assert table.estimate(["CORREIOS", "JADLOG"], ["SP", "SP"], origem="RJ").tolist() == [12, 20]
+
+
+def test_lead_time_table_reloads_changed_file(tmp_path):
+    lead_times_path = tmp_path / "lead_times.json"
+    write_lead_times(lead_times_path, 3)
+    table = LeadTimeTable(str(lead_times_path), reload_interval=30)
+    table.load()
+
+    table.reload_if_changed()
+    assert table.estimate(["CORREIOS"], ["RJ"], origem="SP")[0] == 3
+
+    write_lead_times(lead_times_path, 4)
+    stat = os.stat(lead_times_path)
+    os.utime(lead_times_path, (stat.st_atime, stat.st_mtime + 1))
+    table.reload_if_changed()
+    assert table.estimate(["CORREIOS"], ["RJ"], origem="SP")[0] == 4
+
+    lead_times_path.write_text("{")
+    os.utime(lead_times_path, (stat.st_atime, stat.st_mtime + 2))
+    table.reload_if_changed()
+    assert table.estimate(["CORREIOS"], ["RJ"], origem="SP")[0] == 4
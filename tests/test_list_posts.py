@@ -0,0 +1,160 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+from fastapi import HTTPException
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.configs import settings
+from app.core.deps import CurrentClient, get_current_user
+from app.main import app
+from app.models.address_model import AddressModel
+from app.models.client_auth_model import ClientAuthModel
+from app.models.posting_model import PostModel, PostStatus
+from app.services.posting_services import PostingServices
+
+
+def encode(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    url_postgres = settings.DB_URL
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    db_engine = create_async_engine(url_postgres)
+    try:
+        yield db_engine
+    finally:
+        await db_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def fixtures(db_engine):
+    now = datetime.now(timezone.utc)
+    async with db_engine.begin() as connection:
+        client_id = await connection.scalar(
+            insert(ClientAuthModel).values(
+                data_cadastro=now,
+                nome="Cliente",
+                cpf_cnpj=uuid4().hex[:14],
+                client_secret="segredo",
+                hash_token="token",
+                token_expiracao=now + timedelta(days=1)
+            ).returning(ClientAuthModel.client_id)
+        )
+        address_id = await connection.scalar(
+            insert(AddressModel).values(
+                cep="01001000",
+                cidade="São Paulo",
+                estado="SP",
+                rua="Praça da Sé",
+                bairro="Sé",
+                numero="1"
+            ).returning(AddressModel.id)
+        )
+        post_ids = (await connection.execute(
+            insert(PostModel).returning(PostModel.id, sort_by_parameter_order=True),
+            [
+                {
+                    "endereco_id": address_id,
+                    "client_id": client_id,
+                    "email": "destinatario@email.com",
+                    "peso": 1,
+                    "altura": 10,
+                    "largura": 10,
+                    "comprimento": 10,
+                    "volume": 1000,
+                    "valor_frete": 20,
+                    "data_criacao": now - timedelta(minutes=index),
+                    "status_postagem": post_status,
+                    "previsao_entrega": now + timedelta(days=12),
+                    "transportadora": "CORREIOS",
+                    "codigo_rastreamento": uuid4()
+                }
+                for index, post_status in enumerate(
+                    [PostStatus.CRIADO, PostStatus.EM_TRANSITO, PostStatus.CRIADO]
+                )
+            ]
+        )).scalars().all()
+
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        posting_services = PostingServices(db=session, redis_client=aioredis.FakeRedis(decode_responses=True))
+        yield posting_services, client_id, post_ids
+
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(PostModel).where(PostModel.client_id == client_id))
+        await connection.execute(delete(AddressModel).where(AddressModel.id == address_id))
+        await connection.execute(delete(ClientAuthModel).where(ClientAuthModel.client_id == client_id))
+
+
+@pytest.mark.asyncio
+async def test_list_posts_walks_pages_with_cursor(fixtures):
+    posting_services, client_id, post_ids = fixtures
+
+    first_page = await posting_services.list_posts(client_id=client_id, limit=2, cursor=None, status_postagem=None)
+    second_page = await posting_services.list_posts(
+        client_id=client_id, limit=2, cursor=first_page["proximo_cursor"], status_postagem=None
+    )
+
+    assert [post.id for post in first_page["data"]] == post_ids[:2]
+    assert first_page["proximo_cursor"] is not None
+    assert [post.id for post in second_page["data"]] == post_ids[2:]
+    assert second_page["proximo_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_posts_filters_by_status(fixtures):
+    posting_services, client_id, post_ids = fixtures
+
+    response = await posting_services.list_posts(
+        client_id=client_id, limit=20, cursor=None, status_postagem=PostStatus.CRIADO
+    )
+
+    assert [post.id for post in response["data"]] == [post_ids[0], post_ids[2]]
+    assert response["proximo_cursor"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", [
+    "nao-e-um-cursor",
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+    encode(None),
+    encode([1, 2]),
+    encode({"id": 1}),
+    encode({"data_criacao": "ontem", "id": 1}),
+    encode({"data_criacao": "2024-01-01T00:00:00+00:00", "id": "um"})
+])
+async def test_list_posts_rejects_malformed_cursor(fixtures, cursor):
+    posting_services, client_id, _ = fixtures
+
+    with pytest.raises(HTTPException) as error:
+        await posting_services.list_posts(client_id=client_id, limit=2, cursor=cursor, status_postagem=None)
+
+    assert (error.value.status_code, error.value.detail) == (400, "Cursor de paginação inválido.")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, 101])
+async def test_list_posts_rejects_limit_out_of_bounds(limit):
+    app.dependency_overrides[get_current_user] = lambda: CurrentClient(
+        client_id=1, data_cadastro=datetime.now(timezone.utc), nome="Cliente", cpf_cnpj="12345678901"
+    )
+    app.dependency_overrides[PostingServices] = lambda: None
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get(f"{settings.API_V1}/posting", params={"limit": limit})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "limit"]
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.future import select
+
+from app.core.configs import settings
+from app.models.outbox_model import OutboxMessageModel
+from app.services.outbox_relay import OutboxRelay
+from app.services.rabbitmq_publisher import RabbitmqPublisher
+
+
+class ScriptedPublisher:
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.published = []
+
+    @staticmethod
+    def build_message(body, correlation_id=None, timestamp=None):
+        return RabbitmqPublisher.build_message(body, correlation_id, timestamp)
+
+    async def publish_batch(self, messages):
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        self.published.append([json.loads(message.body) for _, message in messages])
+        return outcome or [None] * len(messages)
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    url_postgres = settings.DB_URL
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    db_engine = create_async_engine(url_postgres)
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(OutboxMessageModel))
+    try:
+        yield db_engine
+    finally:
+        async with db_engine.begin() as connection:
+            await connection.execute(delete(OutboxMessageModel))
+        await db_engine.dispose()
+
+
+async def insert_messages(db_engine, quantity: int):
+    async with db_engine.begin() as connection:
+        result = await connection.execute(
+            insert(OutboxMessageModel).returning(OutboxMessageModel.id, sort_by_parameter_order=True),
+            [
+                {"routing_key": "created_rk", "payload": {"action": "post_created", "data": {"id": index}}}
+                for index in range(quantity)
+            ]
+        )
+        return result.scalars().all()
+
+
+async def pending_ids(db_engine):
+    async with db_engine.connect() as connection:
+        return (await connection.execute(
+            select(OutboxMessageModel.id).order_by(OutboxMessageModel.id)
+        )).scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_deletes_only_confirmed_prefix(db_engine):
+    ids = await insert_messages(db_engine, 3)
+    relay = OutboxRelay(db_engine, ScriptedPublisher([None, RuntimeError("nack"), None]), 10, 0.05)
+
+    async with db_engine.connect() as connection:
+        with pytest.raises(RuntimeError):
+            await relay.relay_batch(connection)
+
+    assert await pending_ids(db_engine) == ids[1:]
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_publishes_in_order_and_deletes_confirmed(db_engine):
+    ids = await insert_messages(db_engine, 3)
+    publisher = ScriptedPublisher()
+    relay = OutboxRelay(db_engine, publisher, 10, 0.05)
+
+    async with db_engine.connect() as connection:
+        assert await relay.relay_batch(connection) == len(ids)
+
+    assert publisher.published == [[{"action": "post_created", "data": {"id": index}} for index in range(3)]]
+    assert await pending_ids(db_engine) == []
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_recovers_after_exception(db_engine):
+    await insert_messages(db_engine, 2)
+    publisher = ScriptedPublisher(RuntimeError("conexão perdida"))
+    relay = OutboxRelay(db_engine, publisher, 10, 0.05)
+
+    relay.start()
+    try:
+        for _ in range(40):
+            if not await pending_ids(db_engine):
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        await relay.stop()
+
+    assert await pending_ids(db_engine) == []
+    assert len(publisher.published) == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_relay_has_a_single_leader(db_engine):
+    async with db_engine.connect() as leader, db_engine.connect() as follower:
+        assert await OutboxRelay.acquire_leadership(leader)
+        assert not await OutboxRelay.acquire_leadership(follower)
+
+        await OutboxRelay.release_leadership(leader)
+        assert await OutboxRelay.acquire_leadership(follower)
+        await OutboxRelay.release_leadership(follower)
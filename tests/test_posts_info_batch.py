@@ -0,0 +1,110 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.configs import settings
+from app.models.address_model import AddressModel
+from app.models.posting_model import PostModel, PostStatus
+from app.services import tracking_cache as tracking_cache_module
+from app.services.posting_services import PostingServices
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    url_postgres = settings.DB_URL
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    db_engine = create_async_engine(url_postgres)
+    try:
+        yield db_engine
+    finally:
+        await db_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def fixtures(db_engine):
+    tracking_cache_module._local_cache.clear()
+    now = datetime.now(timezone.utc)
+    tracking_codes = [uuid4(), uuid4()]
+
+    async with db_engine.begin() as connection:
+        address_id = await connection.scalar(
+            insert(AddressModel).values(
+                cep="01001000",
+                cidade="São Paulo",
+                estado="SP",
+                rua="Praça da Sé",
+                bairro="Sé",
+                numero="1"
+            ).returning(AddressModel.id)
+        )
+        await connection.execute(
+            insert(PostModel),
+            [
+                {
+                    "endereco_id": address_id,
+                    "email": "destinatario@email.com",
+                    "peso": 1,
+                    "altura": 10,
+                    "largura": 10,
+                    "comprimento": 10,
+                    "volume": 1000,
+                    "valor_frete": 20,
+                    "data_criacao": now,
+                    "status_postagem": PostStatus.CRIADO,
+                    "previsao_entrega": now + timedelta(days=12),
+                    "transportadora": "CORREIOS",
+                    "codigo_rastreamento": tracking_code
+                }
+                for tracking_code in tracking_codes
+            ]
+        )
+
+    redis_client = aioredis.FakeRedis(decode_responses=True)
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        yield PostingServices(db=session, redis_client=redis_client), redis_client, tracking_codes
+
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(PostModel).where(PostModel.endereco_id == address_id))
+        await connection.execute(delete(AddressModel).where(AddressModel.id == address_id))
+    tracking_cache_module._local_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_posts_info_mixes_cache_hits_database_hits_and_not_found(fixtures, monkeypatch):
+    posting_services, redis_client, (cached_code, stored_code) = fixtures
+    missing_codes = [uuid4(), uuid4()]
+    cached_json = json.dumps({"codigo_rastreamento": str(cached_code), "origem": "cache"})
+    await redis_client.set(f"post:v2:{cached_code}", cached_json)
+
+    loaded_codes = []
+    load_posts_json = posting_services.load_posts_json
+
+    async def record_load_posts_json(tracking_codes):
+        loaded_codes.append(tracking_codes)
+        return await load_posts_json(tracking_codes)
+
+    monkeypatch.setattr(posting_services, "load_posts_json", record_load_posts_json)
+
+    body = json.loads(await posting_services.get_posts_info(
+        [missing_codes[0], stored_code, cached_code, missing_codes[1], stored_code]
+    ))
+
+    assert body["status_code"] == 200
+    assert body["message"] == "2 postagem(ns) encontrada(s) e 2 não encontrada(s)."
+    assert [post["codigo_rastreamento"] for post in body["data"]] == [str(stored_code), str(cached_code)]
+    assert body["data"][1] == json.loads(cached_json)
+    assert body["nao_encontrados"] == [str(missing_code) for missing_code in missing_codes]
+    assert loaded_codes == [[str(missing_codes[0]), str(stored_code), str(missing_codes[1])]]
+
+    cached_stored_post = json.loads(await redis_client.get(f"post:v2:{stored_code}"))
+    assert cached_stored_post == body["data"][0]
+    assert not await redis_client.exists(f"post:v2:{missing_codes[0]}")
@@ -0,0 +1,64 @@
+import json
+
+import asyncpg
+import pytest
+
+from app.core.configs import settings
+
+HOT_QUERIES = [
+    (
+        "SELECT * FROM clientes WHERE cpf_cnpj = '12345678912'",
+        "ix_clientes_cpf_cnpj"
+    ),
+    (
+        "SELECT * FROM postagens WHERE codigo_rastreamento = 'd343530a-5a8a-4a07-ad51-c6458de8ffd8'",
+        "postagens_codigo_rastreamento_key"
+    ),
+    (
+        "SELECT * FROM postagens WHERE endereco_id = 1",
+        "ix_postagens_endereco_id"
+    ),
+    (
+        "SELECT * FROM postagens WHERE status_postagem = 'CRIADO' ORDER BY data_criacao LIMIT 50",
+        "ix_postagens_status_postagem_data_criacao"
+    ),
+    (
+        "SELECT * FROM postagens WHERE client_id = 1 AND (data_criacao, id) < ('2024-12-22 15:39:18-03', 100) "
+        "ORDER BY data_criacao DESC, id DESC LIMIT 21",
+        "ix_postagens_client_id_data_criacao_id"
+    ),
+    (
+        "SELECT * FROM eventos_postagens WHERE postagem_id = 1 "
+        "AND ocorrido_em BETWEEN '2024-12-01 00:00:00-03' AND '2024-12-31 23:59:59-03' ORDER BY ocorrido_em",
+        "ix_eventos_postagens_postagem_id_ocorrido_em"
+    )
+]
+
+
+def _index_names(plan: dict) -> set:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for subplan in plan.get("Plans", []):
+        names |= _index_names(subplan)
+    return names
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query, index_name", HOT_QUERIES)
+async def test_hot_queries_use_indexes(query: str, index_name: str):
+    url_postgres = settings.DB_URL
+
+    if "+asyncpg" in url_postgres:
+        url_postgres = url_postgres.replace("+asyncpg", "")
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    conn = await asyncpg.connect(dsn=url_postgres)
+    try:
+        await conn.execute("SET enable_seqscan = off")
+        explain = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {query}")
+        plan = json.loads(explain)[0]["Plan"]
+
+        assert index_name in _index_names(plan)
+    finally:
+        await conn.close()
@@ -0,0 +1,98 @@
+import json
+
+import aio_pika
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import rabbitmq_publisher as publisher_module
+from app.services.rabbitmq_publisher import RabbitmqPublisher
+
+
+class FakeExchange:
+    def __init__(self, published):
+        self.published = published
+
+    async def publish(self, message, routing_key):
+        if routing_key == "sem_fila_rk":
+            raise RuntimeError("Mensagem sem fila de destino.")
+        self.published.append((routing_key, json.loads(message.body)))
+
+
+class FakeChannel:
+    is_closed = False
+
+    def __init__(self, published):
+        self.exchange = FakeExchange(published)
+
+    async def get_exchange(self, name, ensure=True):
+        return self.exchange
+
+    async def close(self):
+        pass
+
+
+class FakeConnection:
+    is_closed = False
+
+    def __init__(self):
+        self.reconnect_callbacks = set()
+        self.published = []
+        self.channels = []
+
+    async def channel(self, **kwargs):
+        channel = FakeChannel(self.published)
+        self.channels.append(channel)
+        return channel
+
+    async def close(self):
+        self.is_closed = True
+
+
+def publish_duration_count(routing_key):
+    return REGISTRY.get_sample_value(
+        "rabbitmq_publish_duration_seconds_count", {"routing_key": routing_key}
+    ) or 0
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_publisher_publishes_batch_on_one_channel(monkeypatch):
+    connection = FakeConnection()
+
+    async def connect_robust(url):
+        return connection
+
+    async def declare_topology(channel):
+        pass
+
+    monkeypatch.setattr(aio_pika, "connect_robust", connect_robust)
+    monkeypatch.setattr(publisher_module, "declare_topology", declare_topology)
+
+    publisher = RabbitmqPublisher(exchange="post_exchange", pool_size=2)
+    await publisher.connect()
+    created_before = publish_duration_count("created_rk")
+    unroutable_before = publish_duration_count("sem_fila_rk")
+
+    errors = await publisher.publish_batch([
+        ("created_rk", publisher.build_message({"id": 1})),
+        ("sem_fila_rk", publisher.build_message({"id": 2})),
+        ("created_rk", publisher.build_message({"id": 3}))
+    ])
+    await publisher.close()
+
+    assert [error is None for error in errors] == [True, False, True]
+    assert connection.published == [("created_rk", {"id": 1}), ("created_rk", {"id": 3})]
+    assert len(connection.channels) == 1
+    assert publish_duration_count("created_rk") == created_before + 1
+    assert publish_duration_count("sem_fila_rk") == unroutable_before + 1
+
+
+@pytest.mark.asyncio
+async def test_rabbitmq_publisher_reports_every_message_when_disconnected():
+    publisher = RabbitmqPublisher(exchange="post_exchange", pool_size=2)
+
+    errors = await publisher.publish_batch([
+        ("created_rk", publisher.build_message({"id": 1})),
+        ("created_rk", publisher.build_message({"id": 2}))
+    ])
+
+    assert [type(error) for error in errors] == [ConnectionError, ConnectionError]
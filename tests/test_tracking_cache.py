@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.services import tracking_cache as tracking_cache_module
+from app.services.tracking_cache import INVALIDATION_CHANNEL, TrackingCache, TrackingCacheSubscriber
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    tracking_cache_module._local_cache.clear()
+    yield
+    tracking_cache_module._local_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_tracking_cache_loads_concurrent_misses_once():
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    tracking_cache = TrackingCache(redis_client)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return '{"id": 1}'
+
+    results = await asyncio.gather(*(tracking_cache.get_or_load("codigo", loader) for _ in range(50)))
+
+    assert set(results) == {'{"id": 1}'}
+    assert calls == 1
+    assert await redis_client.get("post:v2:codigo") == '{"id": 1}'
+    assert not await redis_client.exists("post:v2:codigo:lock")
+
+
+@pytest.mark.asyncio
+async def test_tracking_cache_waits_for_lock_holder():
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    await redis_client.set("post:v2:codigo:lock", "outro-processo", px=5000)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return '{"id": 2}'
+
+    async def fill_from_other_process():
+        await asyncio.sleep(0.1)
+        await redis_client.set("post:v2:codigo", '{"id": 1}')
+
+    filler = asyncio.create_task(fill_from_other_process())
+    result = await TrackingCache(redis_client).get_or_load("codigo", loader)
+    await filler
+
+    assert result == '{"id": 1}'
+    assert calls == 0
+
+
+@pytest.mark.asyncio
+async def test_tracking_cache_local_tier_is_invalidated_by_other_workers():
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    tracking_cache = TrackingCache(redis_client)
+    subscriber = TrackingCacheSubscriber(poll_timeout=0.05, reconnect_delay=0.05)
+
+    async def loader():
+        return '{"status_postagem": "CRIADO"}'
+
+    subscriber.start(redis_client)
+    try:
+        await asyncio.sleep(0.1)
+        await tracking_cache.get_or_load("codigo", loader)
+        await redis_client.set("post:v2:codigo", '{"status_postagem": "EM_TRANSITO"}')
+
+        assert await tracking_cache.get_or_load("codigo", loader) == '{"status_postagem": "CRIADO"}'
+
+        await redis_client.publish(INVALIDATION_CHANNEL, "outro-processo:codigo")
+        await asyncio.sleep(0.1)
+
+        assert await tracking_cache.get_or_load("codigo", loader) == '{"status_postagem": "EM_TRANSITO"}'
+    finally:
+        await subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_tracking_cache_fill_does_not_overwrite_concurrent_update():
+    redis_client = FakeAsyncRedis(decode_responses=True)
+    tracking_cache = TrackingCache(redis_client)
+
+    async def loader():
+        post_json = '{"status_postagem": "CRIADO"}'
+        await tracking_cache.set("codigo", '{"status_postagem": "EM_TRANSITO"}', invalidate=True)
+        return post_json
+
+    result = await tracking_cache.get_or_load("codigo", loader)
+
+    assert result == '{"status_postagem": "EM_TRANSITO"}'
+    assert await redis_client.get("post:v2:codigo") == '{"status_postagem": "EM_TRANSITO"}'
+    assert await tracking_cache.get_or_load("codigo", loader) == '{"status_postagem": "EM_TRANSITO"}'
+
+
+@pytest.mark.asyncio
+async def test_tracking_cache_registers_release_lock_script_once(monkeypatch):
+    monkeypatch.setattr(tracking_cache_module, "_release_lock_script", None)
+    registrations = 0
+    register_script = FakeAsyncRedis.register_script
+
+    def count_register_script(self, script):
+        nonlocal registrations
+        registrations += 1
+        return register_script(self, script)
+
+    monkeypatch.setattr(FakeAsyncRedis, "register_script", count_register_script)
+
+    async def loader():
+        return '{"id": 1}'
+
+    for redis_client in [FakeAsyncRedis(server=FakeServer(), decode_responses=True) for _ in range(2)]:
+        for tracking_code in ["codigo-1", "codigo-2"]:
+            assert await TrackingCache(redis_client).get_or_load(tracking_code, loader) == '{"id": 1}'
+            assert not await redis_client.exists(f"post:v2:{tracking_code}:lock")
+
+    assert registrations == 1
@@ -0,0 +1,207 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fakeredis import aioredis
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+
+from app.core.configs import settings
+from app.models.address_model import AddressModel
+from app.models.client_auth_model import ClientAuthModel
+from app.models.outbox_model import OutboxMessageModel
+from app.models.posting_model import PostModel, PostStatus
+from app.schemas.posting_schema import BatchUpdatePostRequest
+from app.services.posting_services import PostingServices
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    url_postgres = settings.DB_URL
+
+    if "@postgres" in url_postgres:
+        url_postgres = url_postgres.replace("@postgres", "@localhost")
+
+    db_engine = create_async_engine(url_postgres)
+    try:
+        yield db_engine
+    finally:
+        await db_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def fixtures(db_engine):
+    now = datetime.now(timezone.utc)
+    async with db_engine.begin() as connection:
+        client_ids = (await connection.execute(
+            insert(ClientAuthModel).returning(ClientAuthModel.client_id, sort_by_parameter_order=True),
+            [
+                {
+                    "data_cadastro": now,
+                    "nome": f"Cliente {index}",
+                    "cpf_cnpj": uuid4().hex[:14],
+                    "client_secret": "segredo",
+                    "hash_token": "token",
+                    "token_expiracao": now + timedelta(days=1)
+                }
+                for index in range(2)
+            ]
+        )).scalars().all()
+        address_id = await connection.scalar(
+            insert(AddressModel).values(
+                cep="01001000",
+                cidade="São Paulo",
+                estado="SP",
+                rua="Praça da Sé",
+                bairro="Sé",
+                numero="1"
+            ).returning(AddressModel.id)
+        )
+
+    post_ids = []
+
+    async def create_post(post_status: PostStatus, client_index: Optional[int] = 0) -> int:
+        async with db_engine.begin() as connection:
+            post_id = await connection.scalar(
+                insert(PostModel).values(
+                    endereco_id=address_id,
+                    client_id=None if client_index is None else client_ids[client_index],
+                    email="destinatario@email.com",
+                    peso=1,
+                    altura=10,
+                    largura=10,
+                    comprimento=10,
+                    volume=1000,
+                    valor_frete=20,
+                    data_criacao=now,
+                    status_postagem=post_status,
+                    previsao_entrega=now + timedelta(days=12),
+                    transportadora="CORREIOS",
+                    codigo_rastreamento=uuid4()
+                ).returning(PostModel.id)
+            )
+            post_ids.append(post_id)
+            return post_id
+
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        posting_services = PostingServices(db=session, redis_client=aioredis.FakeRedis(decode_responses=True))
+        yield posting_services, create_post
+
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(PostModel).where(PostModel.id.in_(post_ids)))
+        await connection.execute(delete(AddressModel).where(AddressModel.id == address_id))
+        await connection.execute(delete(ClientAuthModel).where(ClientAuthModel.client_id.in_(client_ids)))
+        await connection.execute(delete(OutboxMessageModel))
+
+
+async def post_statuses(db_engine, post_ids):
+    async with db_engine.connect() as connection:
+        query = await connection.execute(
+            select(PostModel.id, PostModel.status_postagem).where(PostModel.id.in_(post_ids))
+        )
+        return dict(query.all())
+
+
+@pytest.mark.asyncio
+async def test_update_posts_batch_updates_all_posts(db_engine, fixtures):
+    posting_services, create_post = fixtures
+    on_course_id = await create_post(PostStatus.CRIADO)
+    delivered_id = await create_post(PostStatus.EM_TRANSITO)
+
+    response = await posting_services.update_posts(
+        [
+            BatchUpdatePostRequest(post_id=on_course_id, status_postagem="EM_TRANSITO"),
+            BatchUpdatePostRequest(post_id=delivered_id, status_postagem="ENTREGUE")
+        ]
+    )
+
+    assert response["status_code"] == 200
+    assert [result.status_code for result in response["data"]] == [200, 200]
+    assert await post_statuses(db_engine, [on_course_id, delivered_id]) == {
+        on_course_id: PostStatus.EM_TRANSITO,
+        delivered_id: PostStatus.ENTREGUE
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_posts_batch_reports_partial_failures(db_engine, fixtures):
+    posting_services, create_post = fixtures
+    post_id = await create_post(PostStatus.CRIADO)
+    invalid_id = await create_post(PostStatus.CRIADO)
+    missing_id = await create_post(PostStatus.CRIADO)
+    async with db_engine.begin() as connection:
+        await connection.execute(delete(PostModel).where(PostModel.id == missing_id))
+
+    response = await posting_services.update_posts(
+        [
+            BatchUpdatePostRequest(post_id=post_id, status_postagem="EM_TRANSITO"),
+            BatchUpdatePostRequest(post_id=post_id, status_postagem="ENTREGUE"),
+            BatchUpdatePostRequest(post_id=invalid_id, status_postagem="ENTREGUE"),
+            BatchUpdatePostRequest(post_id=missing_id, status_postagem="EM_TRANSITO")
+        ]
+    )
+
+    assert response["status_code"] == 207
+    assert [result.status_code for result in response["data"]] == [200, 400, 400, 404]
+    assert await post_statuses(db_engine, [post_id, invalid_id]) == {
+        post_id: PostStatus.EM_TRANSITO,
+        invalid_id: PostStatus.CRIADO
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_posts_batch_updates_posts_of_any_client_and_without_client(db_engine, fixtures):
+    posting_services, create_post = fixtures
+    other_client_id = await create_post(PostStatus.CRIADO, client_index=1)
+    legacy_id = await create_post(PostStatus.CRIADO, client_index=None)
+
+    response = await posting_services.update_posts(
+        [
+            BatchUpdatePostRequest(post_id=other_client_id, status_postagem="EM_TRANSITO"),
+            BatchUpdatePostRequest(post_id=legacy_id, status_postagem="EM_TRANSITO")
+        ]
+    )
+
+    assert response["status_code"] == 200
+    assert await post_statuses(db_engine, [other_client_id, legacy_id]) == {
+        other_client_id: PostStatus.EM_TRANSITO,
+        legacy_id: PostStatus.EM_TRANSITO
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_posts_batch_conflicts_when_status_changes_concurrently(db_engine, fixtures, monkeypatch):
+    posting_services, create_post = fixtures
+    post_id = await create_post(PostStatus.CRIADO)
+    concurrent_id = await create_post(PostStatus.CRIADO)
+
+    execute = posting_services.db.execute
+    statements = 0
+
+    async def execute_with_concurrent_update(statement, *args, **kwargs):
+        nonlocal statements
+        result = await execute(statement, *args, **kwargs)
+        statements += 1
+        if statements == 1:
+            async with db_engine.begin() as connection:
+                await connection.execute(
+                    update(PostModel)
+                    .where(PostModel.id == concurrent_id)
+                    .values(status_postagem=PostStatus.EM_TRANSITO)
+                )
+        return result
+
+    monkeypatch.setattr(posting_services.db, "execute", execute_with_concurrent_update)
+
+    response = await posting_services.update_posts(
+        [
+            BatchUpdatePostRequest(post_id=post_id, status_postagem="EM_TRANSITO"),
+            BatchUpdatePostRequest(post_id=concurrent_id, status_postagem="EM_TRANSITO")
+        ]
+    )
+
+    assert response["status_code"] == 207
+    assert [result.status_code for result in response["data"]] == [200, 409]